@@ -0,0 +1,214 @@
+import os
+import random
+
+import pytest
+
+import validator
+
+
+# Pieces that exercise every corner of the decoder: ASCII, stray
+# continuation bytes, overlong and surrogate leads, truncated sequences,
+# out-of-range leads, genuine U+FFFD and valid 2/3/4-byte characters
+PIECES = [
+    b"a", b"\x80", b"\xbf", b"\xc0", b"\xc1", b"\xc2", b"\xdf", b"\xe0", b"\xa0",
+    b"\xed", b"\x9f", b"\xef", b"\xbd", b"\xf0", b"\x90", b"\xf4", b"\x8f", b"\xf5",
+    b"\xff", b"\xef\xbf\xbd", "é".encode(), "日".encode(), "😀".encode(),
+]
+
+# Validation with and without the JIT-compiled kernels
+PATHS = [False, True] if validator._HAS_NUMBA else [False]
+
+
+@pytest.fixture(params=PATHS, ids=lambda jit: "numba" if jit else "python")
+def jit(request, monkeypatch):
+    monkeypatch.setattr(validator, "_HAS_NUMBA", request.param)
+    return request.param
+
+
+def _random_inputs(n, max_pieces, seed):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield b"".join(rng.choice(PIECES) for _ in range(rng.randint(1, max_pieces)))
+
+
+def _expected(data):
+    """(is_utf, total_chars, non_utf_chars) as a plain bytes.decode() sees it."""
+    text = data.decode("utf-8", "replace")
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError:
+        return False, len(text), text.count("\ufffd")
+    return True, len(text), 0
+
+
+def _observed(result):
+    return result["is_utf"], result["total_chars"], result["non_utf_chars"]
+
+
+def test_scan_bytes_matches_decode(jit):
+    for data in _random_inputs(3000, 40, seed=1):
+        assert _observed(validator.scan_bytes(data)) == _expected(data), data
+
+
+def test_state_matches_decode_on_random_splits(jit):
+    rng = random.Random(2)
+    for data in _random_inputs(3000, 40, seed=3):
+        state = validator.ValidatorState()
+        i = 0
+        while i < len(data):
+            k = rng.randint(1, 5)
+            state.update(data[i:i + k])
+            i += k
+        assert _observed(state.finalize()) == _expected(data), data
+
+
+@pytest.mark.parametrize("text", ["é", "日", "😀", "\ufffd"])
+def test_state_matches_decode_at_every_split(jit, text):
+    # A multi-byte character, valid or cut short, split at each offset
+    for data in (("ab" + text + "cd").encode(), ("ab" + text).encode()[:-1], b"x" + text.encode()[:-1] + b"y"):
+        for cut in range(len(data) + 1):
+            state = validator.ValidatorState()
+            state.update(data[:cut])
+            state.update(data[cut:])
+            assert _observed(state.finalize()) == _expected(data), (data, cut)
+
+
+def test_chunk_boundaries_in_large_input(jit):
+    # Multi-byte sequences straddle the CHUNK_SIZE and SCAN_SLICE_SIZE
+    # boundaries scan_bytes works at
+    for size in (validator.CHUNK_SIZE * 3, validator.SCAN_SLICE_SIZE + 5):
+        for tail in (b"", b"\xff", b"\xe6\x97"):
+            data = ("é日😀".encode() * size)[:size] + tail
+            assert _observed(validator.scan_bytes(data)) == _expected(data)
+
+
+@pytest.mark.parametrize("tail", [b"", b"\xff"])
+def test_mapped_file_matches_decode(jit, tmp_path, tail):
+    # Files from MMAP_THRESHOLD up are scanned through an mmap whose pages
+    # are released as the scan goes
+    data = ("日本語 text\n".encode() * validator.MMAP_THRESHOLD)[:validator.SCAN_SLICE_SIZE * 2 + 1] + tail
+    path = tmp_path / "big.txt"
+    path.write_bytes(data)
+    assert _observed(validator._scan_file(str(path), len(data))) == _expected(data)
+
+
+def test_empty_and_ascii():
+    assert validator.scan_bytes(b"")["detected_encoding"] == "UTF-8 (empty)"
+    assert _observed(validator.scan_bytes(b"plain text\n")) == (True, 11, 0)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Points the result cache at tmp_path and returns the list of paths actually scanned."""
+    monkeypatch.setattr(validator, "CACHE_PATH", str(tmp_path / "cache.db"))
+    scanned = []
+    scan_file = validator._scan_file
+
+    def counting(path, size):
+        scanned.append(path)
+        return scan_file(path, size)
+
+    monkeypatch.setattr(validator, "_scan_file", counting)
+    return scanned
+
+
+def test_cache_hit(cache, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes("café".encode("latin-1"))
+    first = validator.scan_single_file(str(path))
+    assert validator.scan_single_file(str(path)) == first
+    assert cache == [str(path)]
+
+
+def test_cache_invalidated_by_mtime_and_size(cache, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"plain")
+    validator.scan_single_file(str(path))
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    validator.scan_single_file(str(path))
+    assert len(cache) == 2
+
+    # Same mtime, different size
+    path.write_bytes("cafés".encode())
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert validator.scan_single_file(str(path))["total_chars"] == 5
+    assert len(cache) == 3
+
+
+def test_cache_version_bump_drops_entries(cache, tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"plain")
+    validator.scan_single_file(str(path))
+    monkeypatch.setattr(validator, "CACHE_VERSION", validator.CACHE_VERSION + 1)
+    validator.scan_single_file(str(path))
+    validator.scan_single_file(str(path))
+    assert len(cache) == 2
+
+
+def test_cache_off(cache, tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"plain")
+    validator.scan_single_file(str(path), cache=False)
+    monkeypatch.setattr(validator, "CACHE_PATH", None)
+    validator.scan_single_file(str(path))
+    validator.scan_single_file(str(path))
+    assert len(cache) == 3
+    assert not (tmp_path / "cache.db").exists()
+
+
+def test_prune_cache(cache, tmp_path):
+    kept, gone = tmp_path / "kept.txt", tmp_path / "gone.txt"
+    for path in (kept, gone):
+        path.write_bytes(b"plain")
+        validator.scan_single_file(str(path))
+    gone.unlink()
+    assert validator.prune_cache() == 1
+    assert validator.prune_cache() == 0
+    validator.scan_single_file(str(kept))
+    assert len(cache) == 2
+
+
+def _pe_header():
+    header = bytearray(0x100)
+    header[:2] = b"MZ"
+    header[0x3C:0x40] = (0x80).to_bytes(4, "little")
+    header[0x80:0x84] = b"PE\0\0"
+    return bytes(header) + b"\x90" * 512
+
+
+@pytest.mark.parametrize("data", [
+    b"MZ,Mozambique\nZA,South Africa\n" * 20,
+    "MZUNGU café\n".encode() * 20,
+    "MZ header text".encode() + b" " * 0x40 + b"PE\0\0",   # PE signature not where e_lfanew points
+])
+def test_mz_text_is_not_binary(data):
+    assert not validator.scan_bytes(data)["is_binary"]
+
+
+def test_pe_header_is_binary():
+    assert validator.scan_bytes(_pe_header())["is_binary"]
+
+
+@pytest.mark.parametrize("encoding, bom", [
+    ("utf-16-le", b"\xff\xfe"), ("utf-16-be", b"\xfe\xff"),
+    ("utf-32-le", b"\xff\xfe\x00\x00"), ("utf-32-be", b"\x00\x00\xfe\xff"),
+])
+def test_wide_text_with_bom_is_not_binary(encoding, bom):
+    result = validator.scan_bytes(bom + "héllo wörld\n".encode(encoding) * 50)
+    assert not result["is_binary"]
+    assert result["detected_encoding"].startswith(encoding[:6].upper())
+
+
+@pytest.mark.parametrize("magic", [b"PK\x03\x04", b"\x89PNG\r\n\x1a\n", b"%PDF-1.7\n"])
+def test_binary_signature_behind_txt_extension(tmp_path, magic):
+    path = tmp_path / "looks_like_text.txt"
+    path.write_bytes(magic + b"plain looking text\n" * 20)
+    assert validator.scan_single_file(str(path), cache=False)["is_binary"]
+
+
+def test_nul_heavy_content_is_binary():
+    assert validator.scan_bytes(b"ab\0\0" * 100)["is_binary"]
+    # ... but a stray NUL isn't
+    assert not validator.scan_bytes(b"plain text\0" + b"more text\n" * 20)["is_binary"]
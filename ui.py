@@ -1,106 +1,153 @@
 import sys
 import os
 import csv
+import io
+from array import array
+from itertools import groupby
 from datetime import datetime
 
+import numpy as np
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel,
-    QPushButton, QFileDialog, QFrame,
-    QScrollArea, QHBoxLayout, QProgressBar, QSizePolicy, QMessageBox
+    QPushButton, QFileDialog, QFrame, QListView, QStyledItemDelegate,
+    QHBoxLayout, QProgressBar, QSizePolicy, QMessageBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from validator import scan_single_file, scan_folder
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QAbstractListModel, QModelIndex, QRectF, QSize,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QColor, QFont, QPainter
 
+from validator import (
+    scan_single_file, scan_files, walk_files, error_result, load_kernels, kernels_loaded, prune_cache,
+    MMAP_THRESHOLD, MAX_FILE_SIZE
+)
 
-# ---------------- Animation Thread ----------------
-class AnimThread(QThread):
-    tick = pyqtSignal()
 
-    def run(self):
-        while not self.isInterruptionRequested():
-            self.msleep(1000)
-            if not self.isInterruptionRequested():
-                self.tick.emit()
+def _summarize(results):
+    """Counts per category and the average UTF %, in one vectorized pass."""
+    n       = len(results)
+    binary  = np.fromiter((r.get("is_binary", False) for r in results), dtype=bool, count=n)
+    skipped = np.fromiter((r.get("is_skipped", False) for r in results), dtype=bool, count=n)
+    is_utf  = np.fromiter((r["is_utf"] for r in results), dtype=bool, count=n) & ~binary
+    mostly  = np.fromiter((r["is_mostly_utf"] for r in results), dtype=bool, count=n) & ~binary & ~is_utf
+    pcts    = np.fromiter((r["utf_percent"] for r in results), dtype=np.float64, count=n)
+    # Skipped files were never read, so they don't count towards the average
+    checked = pcts[~skipped]
+    avg_utf = round(float(checked.mean()), 1) if checked.size else 0.0
+    return {
+        "utf":             int(is_utf.sum()),
+        "non_utf":         int(n - binary.sum() - skipped.sum() - is_utf.sum() - mostly.sum()),
+        "mixed":           int(mostly.sum()),
+        "binary":          int(binary.sum()),
+        "skipped":         int(skipped.sum()),
+        "total":           n,
+        "avg_utf_percent": avg_utf
+    }
 
 
 # ---------------- Worker Thread ----------------
 class ScanThread(QThread):
     finished_signal = pyqtSignal(dict)
+    progress_signal = pyqtSignal(int, int)
 
     def __init__(self, file_path=None, folder_path=None):
         super().__init__()
         self.file_path = file_path
         self.folder_path = folder_path
+        # Filled in by run(); read on the GUI thread once finished_signal fires,
+        # so the full list never has to be copied through the signal
+        self.results = []
 
     def run(self):
         results = []
-        utf_count     = 0
-        non_utf_count = 0
-        mixed_count   = 0
-        binary_count  = 0
-        total_utf_percent = 0.0
-
-        def categorize(info):
-            nonlocal utf_count, non_utf_count, mixed_count, binary_count, total_utf_percent
-            if info.get("is_binary"):
-                binary_count += 1
-            elif info["is_utf"]:
-                utf_count += 1
-            elif info["is_mostly_utf"]:
-                mixed_count += 1
-            else:
-                non_utf_count += 1
-            total_utf_percent += info["utf_percent"]
-
-        if self.file_path:
-            info = scan_single_file(self.file_path)
-            info["filename"] = os.path.basename(self.file_path)
-            info["file"]     = self.file_path
-            results.append(info)
-            categorize(info)
-
-        elif self.folder_path:
-            all_files = []
-            for root, dirs, files in os.walk(self.folder_path):
-                for f in files:
-                    all_files.append(os.path.join(root, f))
-            for full_path in all_files:
-                info = scan_single_file(full_path)
-                info["file"]     = full_path
-                info["filename"] = os.path.basename(full_path)
+        try:
+            if self.file_path:
+                info = scan_single_file(self.file_path)
+                info["filename"] = os.path.basename(self.file_path)
+                info["file"]     = self.file_path
                 results.append(info)
-                categorize(info)
 
-        avg_utf = round(total_utf_percent / len(results), 1) if results else 0.0
+            elif self.folder_path:
+                entries = list(walk_files(self.folder_path))
+                total   = len(entries)
+                # Report progress roughly every 1% instead of once per file
+                self._step = max(1, total // 100)
+                self.progress_signal.emit(0, total)
+                infos = scan_files([e.path for e in entries], self._report)
+                # The name comes from scandir, so no basename() per file
+                for entry, info in zip(entries, infos):
+                    info["file"]     = entry.path
+                    info["filename"] = entry.name
+                    results.append(info)
+        except Exception as e:
+            # An exception escaping a Python QThread.run aborts the process,
+            # so the failure is listed as one more error result instead
+            target = self.file_path or self.folder_path
+            info = error_result(e)
+            info["file"]     = target
+            info["filename"] = os.path.basename(target)
+            results.append(info)
+
+        self.results = results
+        self.finished_signal.emit(_summarize(results))
+
+    def _report(self, done, total):
+        if done % self._step == 0 or done == total:
+            self.progress_signal.emit(done, total)
+
+
+# ---------------- Startup Jobs ----------------
+class KernelLoadRunnable(QRunnable):
+    """Loads validator's JIT kernels at startup, so no scan on the GUI thread waits for them."""
+
+    def run(self):
+        load_kernels()
+
+
+class CachePruneRunnable(QRunnable):
+    """Drops cached results of deleted files at startup, off the GUI thread."""
+
+    def run(self):
+        prune_cache()
+
+
+# ---------------- Folder Counter ----------------
+class FolderCountSignals(QObject):
+    finished = pyqtSignal(str, int)
 
-        self.finished_signal.emit({
-            "results":         results,
-            "utf":             utf_count,
-            "non_utf":         non_utf_count,
-            "mixed":           mixed_count,
-            "binary":          binary_count,
-            "total":           len(results),
-            "avg_utf_percent": avg_utf
-        })
+
+class FolderCountRunnable(QRunnable):
+    """
+    Counts the files a folder scan will visit, off the GUI thread,
+    with the same walk_files the scan itself uses.
+    """
+
+    def __init__(self, folder):
+        super().__init__()
+        self.folder  = folder
+        self.signals = FolderCountSignals()
+
+    def run(self):
+        n = sum(1 for _ in walk_files(self.folder))
+        self.signals.finished.emit(self.folder, n)
 
 
 # ---------------- Animated Loader Widget ----------------
 class LoaderWidget(QFrame):
-    FRAMES = [
+    FRAMES = (
         ("🕵️", "Detecting encodings..."),
         ("🔬", "Checking UTF validity..."),
         ("🚀", "Almost there..."),
         ("✨", "Wrapping things up..."),
         ("🎯", "Finalizing results..."),
-    ]
+    )
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._index = 0
-        self.setStyleSheet("QFrame { background: transparent; } QLabel { background: transparent; }")
+        self.setObjectName("loader")
 
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 20, 10, 10)
@@ -109,12 +156,12 @@ class LoaderWidget(QFrame):
 
         self.emoji_lbl = QLabel("🔍")
         self.emoji_lbl.setAlignment(Qt.AlignCenter)
-        self.emoji_lbl.setStyleSheet("font-size: 48px; background: transparent;")
+        self.emoji_lbl.setObjectName("bigEmoji")
         layout.addWidget(self.emoji_lbl)
 
         self.text_lbl = QLabel("Sniffing out files...")
         self.text_lbl.setAlignment(Qt.AlignCenter)
-        self.text_lbl.setStyleSheet("font-size: 14px; color: #60a5fa; font-weight: bold;")
+        self.text_lbl.setObjectName("loaderText")
         self.text_lbl.setWordWrap(True)
         layout.addWidget(self.text_lbl)
 
@@ -139,6 +186,360 @@ class LoaderWidget(QFrame):
         self.text_lbl.setText(text)
 
 
+# ---------------- Results Model ----------------
+class ResultsModel(QAbstractListModel):
+    """Holds the raw result dicts; the delegate reads them via Qt.UserRole."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._results)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self._results[index.row()]
+        if role == Qt.UserRole:
+            return r
+        if role == Qt.DisplayRole:
+            return r.get("filename", "Unknown")
+        return None
+
+    def setResults(self, results):
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+
+
+# ---------------- Result Card Delegate ----------------
+# Per-category card colors, built once: (border, background, tag text, tag, bar)
+CAT_BINARY, CAT_UTF, CAT_MOSTLY, CAT_NON_UTF, CAT_SKIPPED = range(5)
+CARD_STYLES = tuple(
+    (QColor(border), QColor(bg), tag_text, QColor(tag), QColor(bar))
+    for border, bg, tag_text, tag, bar in (
+        ("#8b5cf6", "#f5f3ff", "📦 Binary",     "#8b5cf6", "#8b5cf6"),
+        ("#10b981", "#ecfdf5", "✅ 100% UTF",   "#10b981", "#10b981"),
+        ("#f59e0b", "#fffbeb", "🔶 Mostly UTF", "#f59e0b", "#f59e0b"),
+        ("#ef4444", "#fef2f2", "⚠️ Non-UTF",    "#ef4444", "#ef4444"),
+        ("#6b7280", "#f3f4f6", "⏭️ Skipped",    "#6b7280", "#6b7280"),
+    )
+)
+
+# Donut chart slices: summary key, label, color
+CHART_KEYS   = ("utf", "mixed", "non_utf", "binary", "skipped")
+CHART_LABELS = ("100% UTF", "Mostly UTF", "Non-UTF", "Binary", "Skipped")
+CHART_COLORS = ("#10b981", "#f59e0b", "#ef4444", "#8b5cf6", "#6b7280")
+
+
+def _cat(r):
+    if r.get("is_binary", False):
+        return CAT_BINARY
+    if r.get("is_skipped", False):
+        return CAT_SKIPPED
+    if r.get("is_utf", False):
+        return CAT_UTF
+    return CAT_MOSTLY if r.get("is_mostly_utf", False) else CAT_NON_UTF
+
+
+# Status column text in exports, indexed by category
+STATUS_LABELS = ("Binary", "100% UTF", "Mostly UTF", "Non-UTF", "Skipped")
+
+# One-line note on the short cards of files that were not checked
+UNCHECKED_NOTES = {
+    CAT_BINARY:  "Binary file — encoding check not applicable",
+    CAT_SKIPPED: f"Larger than {MAX_FILE_SIZE // (1024 * 1024)} MB — not scanned",
+}
+
+
+def _columns(results):
+    """
+    The export fields of results as one column per field, in CSV column
+    order. Statuses are stored as category codes.
+    """
+    return {
+        "filename":          [r.get("filename", "") for r in results],
+        "status":            array("b", map(_cat, results)),
+        "detected_encoding": [r.get("detected_encoding", "") for r in results],
+        "total_chars":       array("q", (r.get("total_chars", 0) for r in results)),
+        "non_utf_chars":     array("q", (r.get("non_utf_chars", 0) for r in results)),
+        "utf_percent":       array("d", (r.get("utf_percent", 0) for r in results)),
+        "non_utf_percent":   array("d", (r.get("non_utf_percent", 0) for r in results)),
+    }
+
+
+class ResultCardDelegate(QStyledItemDelegate):
+    """
+    Paints one result card per row with QPainter. Qt only asks the
+    delegate about visible rows, so no widgets are created per file.
+    """
+    GAP         = 10    # space between cards
+    PAD_X       = 15
+    PAD_Y       = 10
+    TAG_H       = 24
+    BINARY_H    = 70
+    TEXT_H      = 112
+    DONUT       = 62
+
+    # paint() runs for every visible row on every repaint, so colors and
+    # fonts are built once instead of per call
+    WHITE       = QColor("white")
+    NAME_COLOR  = QColor("#1f2937")
+    STATS_COLOR = QColor("#6b7280")
+    RING_COLOR  = QColor("#e5e7eb")
+    TRACK_COLOR = QColor("#f3f4f6")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fonts = {}
+
+    def sizeHint(self, option, index):
+        r = index.data(Qt.UserRole)
+        h = self.BINARY_H if _cat(r) in UNCHECKED_NOTES else self.TEXT_H
+        return QSize(option.rect.width(), h + self.GAP)
+
+    def _font(self, base, px, bold=False):
+        key = (base.key(), px, bold)
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = QFont(base)
+            f.setPixelSize(px)
+            f.setBold(bold)
+        return f
+
+    def paint(self, painter, option, index):
+        r = index.data(Qt.UserRole)
+        utf_pct     = r.get("utf_percent", 0.0)
+        non_utf_pct = r.get("non_utf_percent", 0.0)
+        cat         = _cat(r)
+        is_utf      = cat == CAT_UTF
+        border_color, bg_color, tag_text, tag_color, bar_color = CARD_STYLES[cat]
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        # Card background with a 4px left border
+        card = QRectF(option.rect).adjusted(0, 0, 0, -self.GAP)
+        painter.setBrush(border_color)
+        painter.drawRoundedRect(card, 8, 8)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(card.adjusted(4, 0, 0, 0), 8, 8)
+
+        inner = card.adjusted(self.PAD_X, self.PAD_Y, -self.PAD_X, -self.PAD_Y)
+
+        # Top row: tag pill on the right, filename on the left
+        tag_font = self._font(option.font, 11, bold=True)
+        painter.setFont(tag_font)
+        tag_w = painter.fontMetrics().horizontalAdvance(tag_text) + 20
+        tag_rect = QRectF(inner.right() - tag_w, inner.top(), tag_w, self.TAG_H)
+        painter.setBrush(tag_color)
+        painter.drawRoundedRect(tag_rect, 6, 6)
+        painter.setPen(self.WHITE)
+        painter.drawText(tag_rect, Qt.AlignCenter, tag_text)
+
+        painter.setFont(self._font(option.font, 13, bold=True))
+        painter.setPen(self.NAME_COLOR)
+        name_rect = QRectF(inner.left(), inner.top(), tag_rect.left() - inner.left() - 10, self.TAG_H)
+        name = painter.fontMetrics().elidedText(
+            r.get("filename", "Unknown"), Qt.ElideMiddle, int(name_rect.width()))
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        body = QRectF(inner.left(), inner.top() + self.TAG_H + 6,
+                      inner.width(), inner.bottom() - inner.top() - self.TAG_H - 6)
+        small = self._font(option.font, 11)
+
+        if cat in UNCHECKED_NOTES:
+            painter.setFont(small)
+            painter.setPen(border_color)
+            painter.drawText(body, Qt.AlignLeft | Qt.AlignTop, UNCHECKED_NOTES[cat])
+            painter.restore()
+            return
+
+        total_chars   = r.get("total_chars", 0)
+        non_utf_chars = r.get("non_utf_chars", 0)
+        detected_enc  = r.get("detected_encoding", "Unknown")
+
+        # Mini donut for non-utf / mostly-utf
+        if not is_utf:
+            donut = QRectF(body.right() - self.DONUT, body.top(), self.DONUT, self.DONUT)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.RING_COLOR)
+            painter.drawEllipse(donut)
+            painter.setBrush(bar_color)
+            painter.drawPie(donut, 90 * 16, -int(utf_pct * 360 / 100 * 16))
+            ring = self.DONUT / 7    # thin enough that the label fits in the hole
+            painter.setBrush(bg_color)
+            painter.drawEllipse(donut.adjusted(ring, ring, -ring, -ring))
+            painter.setFont(self._font(option.font, 9, bold=True))
+            painter.setPen(bar_color)
+            painter.drawText(donut, Qt.AlignCenter, f"{utf_pct}%")
+            painter.setPen(Qt.NoPen)
+            body.setRight(donut.left() - 15)
+
+        line_h = 16
+        painter.setFont(self._font(option.font, 11, bold=True))
+        painter.setPen(border_color)
+        enc = painter.fontMetrics().elidedText(
+            f"Detected encoding: {detected_enc}", Qt.ElideRight, int(body.width()))
+        painter.drawText(QRectF(body.left(), body.top(), body.width(), line_h),
+                         Qt.AlignLeft | Qt.AlignVCenter, enc)
+
+        painter.setFont(small)
+        painter.setPen(self.STATS_COLOR)
+        stats = (f"Total chars: {total_chars:,}  •  Invalid chars: {non_utf_chars:,}  •  "
+                 f"UTF: {utf_pct}%  |  Non-UTF: {non_utf_pct}%")
+        stats = painter.fontMetrics().elidedText(stats, Qt.ElideRight, int(body.width()))
+        painter.drawText(QRectF(body.left(), body.top() + line_h + 5, body.width(), line_h),
+                         Qt.AlignLeft | Qt.AlignVCenter, stats)
+
+        # UTF progress bar row
+        bar_y = body.top() + 2 * (line_h + 5)
+        painter.setFont(self._font(option.font, 10, bold=True))
+        painter.setPen(bar_color)
+        painter.drawText(QRectF(body.left(), bar_y, 28, line_h), Qt.AlignLeft | Qt.AlignVCenter, "UTF")
+        painter.setFont(self._font(option.font, 11, bold=True))
+        pct_rect = QRectF(body.right() - 48, bar_y, 48, line_h)
+        painter.drawText(pct_rect, Qt.AlignRight | Qt.AlignVCenter, f"{utf_pct}%")
+        painter.setPen(Qt.NoPen)
+        track = QRectF(body.left() + 36, bar_y + (line_h - 10) / 2,
+                       pct_rect.left() - body.left() - 44, 10)
+        painter.setBrush(self.TRACK_COLOR)
+        painter.drawRoundedRect(track, 5, 5)
+        if utf_pct > 0:
+            painter.setBrush(bar_color)
+            painter.drawRoundedRect(QRectF(track.left(), track.top(),
+                                           max(10.0, track.width() * min(utf_pct, 100) / 100), 10), 5, 5)
+
+        painter.restore()
+
+
+# ---------------- Stylesheet ----------------
+# Parsed once and applied to the main window; widgets pick their rules by
+# objectName and switch state through dynamic properties (see _restyle).
+GLOBAL_QSS = """
+QWidget { background-color: #f5f7fb; font-family: Segoe UI; }
+
+/* ---- Sidebar ---- */
+QFrame#sidebar { background-color: #1f2937; }
+#sidebar QLabel { color: #e5e7eb; background: transparent; }
+QLabel#appTitle    { font-size: 20px; font-weight: bold; color: white; }
+QLabel#appSubtitle { font-size: 11px; color: #6b7280; }
+QFrame#divider     { background-color: #374151; max-height: 1px; margin: 0px; }
+QLabel#sectionLabel { font-size: 10px; color: #6b7280; letter-spacing: 2px; }
+
+QPushButton#sourceBtn {
+    background-color: #374151;
+    color: white;
+    border-radius: 12px;
+    font-size: 15px;
+    font-weight: bold;
+    text-align: center;
+    padding: 18px;
+    border: 2px solid transparent;
+}
+QPushButton#sourceBtn:hover {
+    background-color: #4b5563;
+    border: 2px solid #60a5fa;
+}
+QPushButton#sourceBtn[selected="false"] {
+    font-size: 14px; text-align: left; padding: 12px 16px;
+}
+QPushButton#sourceBtn[selected="true"] {
+    background-color: #1e3a5f;
+    font-size: 14px; text-align: left; padding: 12px 16px;
+    border: 2px solid #60a5fa;
+}
+QPushButton#sourceBtn[selected="true"]:hover { background-color: #1e3a5f; border: 2px solid #93c5fd; }
+
+QLabel#sourceLabel { font-size: 11px; color: #6b7280; padding-left: 6px; }
+QLabel#sourceLabel[selected="true"] { color: #60a5fa; }
+QLabel#folderCount { font-size: 11px; color: #60a5fa; padding-left: 6px; }
+
+QPushButton#scanBtn {
+    background-color: #2563eb; color: white;
+    padding: 14px; border-radius: 12px;
+    font-size: 18px; font-weight: bold;
+    border: 2px solid transparent;
+}
+QPushButton#scanBtn:hover    { background-color: #1d4ed8; border: 2px solid #93c5fd; }
+QPushButton#scanBtn:disabled { background-color: #374151; color: #6b7280; border: none; }
+
+QPushButton#clearBtn {
+    background-color: transparent; color: #9ca3af;
+    border-radius: 10px; font-size: 14px;
+    border: 2px solid #374151;
+}
+QPushButton#clearBtn:hover { background-color: #374151; color: white; border: 2px solid #4b5563; }
+
+QFrame#scanComplete, QFrame#exportPanel, QFrame#loader { background: transparent; }
+QLabel#bigEmoji { font-size: 48px; }
+QLabel#scanCompleteTitle { font-size: 16px; font-weight: bold; color: #10b981; }
+QLabel#loaderText { font-size: 14px; color: #60a5fa; font-weight: bold; }
+
+QPushButton#exportCsvBtn {
+    background-color: #95B9C7; color: white;
+    border-radius: 10px; font-size: 14px; font-weight: bold;
+    border: 2px solid #10b981;
+}
+QPushButton#exportCsvBtn:hover { background-color: #047857; }
+QPushButton#exportPdfBtn {
+    background-color: #1e3a5f; color: white;
+    border-radius: 10px; font-size: 14px; font-weight: bold;
+    border: 2px solid #3b82f6;
+}
+QPushButton#exportPdfBtn:hover { background-color: #1d4ed8; }
+
+QLabel#footer { font-size: 10px; color: #374151; }
+
+/* ---- Content ---- */
+QFrame#content { background-color: #f5f7fb; }
+QLabel#pageTitle    { font-size: 22px; font-weight: bold; color: #1f2937; }
+QLabel#pageSubtitle { font-size: 13px; color: #6b7280; }
+
+QFrame#card-total, QFrame#card-utf, QFrame#card-mixed,
+QFrame#card-nonutf, QFrame#card-binary, QFrame#card-skipped { border-radius: 15px; }
+QFrame#card-total  { background-color: #3b82f6; }
+QFrame#card-utf    { background-color: #10b981; }
+QFrame#card-mixed  { background-color: #f59e0b; }
+QFrame#card-nonutf { background-color: #ef4444; }
+QFrame#card-binary { background-color: #8b5cf6; }
+QFrame#card-skipped { background-color: #6b7280; }
+QLabel#cardIcon  { font-size: 22px; color: white; background: transparent; }
+QLabel#cardValue { font-size: 32px; font-weight: bold; color: white; background: transparent; }
+QLabel#cardTitle { font-size: 11px; color: rgba(255,255,255,0.85); background: transparent; }
+
+QFrame#avgFrame, #avgFrame QLabel { background: white; border-radius: 12px; }
+QLabel#avgLabel { font-size: 13px; color: #374151; font-weight: bold; }
+QProgressBar#avgBar { background-color: #f3f4f6; border-radius: 9px; border: none; }
+QProgressBar#avgBar::chunk { background-color: #10b981; border-radius: 9px; }
+QProgressBar#avgBar[level="warn"]::chunk { background-color: #f59e0b; }
+QProgressBar#avgBar[level="bad"]::chunk  { background-color: #ef4444; }
+QLabel#avgPct { font-size: 14px; font-weight: bold; color: #10b981; min-width: 45px; }
+QLabel#avgPct[level="warn"] { color: #f59e0b; }
+QLabel#avgPct[level="bad"]  { color: #ef4444; }
+
+QProgressBar#scanProgress { background-color: #e5e7eb; border-radius: 3px; border: none; }
+QProgressBar#scanProgress::chunk { background-color: #3b82f6; border-radius: 3px; }
+
+QFrame#panel, #panel QLabel { background: white; border-radius: 15px; }
+QLabel#panelTitle { font-size: 14px; font-weight: bold; color: #1f2937; }
+QLabel#chartPlaceholder { font-size: 13px; color: #9ca3af; }
+QLabel#resultsTitle { font-size: 14px; font-weight: bold; color: #1f2937; margin-bottom: 10px; }
+QListView#resultsView { border: none; background: transparent; }
+#resultsView QScrollBar:vertical { background: #f3f4f6; width: 8px; border-radius: 4px; }
+#resultsView QScrollBar::handle:vertical { background: #d1d5db; border-radius: 4px; }
+"""
+
+
+def _restyle(widget, prop, value):
+    """Switches a dynamic property and re-polishes so GLOBAL_QSS re-applies."""
+    widget.setProperty(prop, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
 # ---------------- Main UI ----------------
 class UTFValidatorApp(QWidget):
     def __init__(self):
@@ -147,19 +548,24 @@ class UTFValidatorApp(QWidget):
         self.selected_file   = None
         self.selected_folder = None
         self._last_results   = []
+        self._cols           = _columns([])   # _last_results by column, for exports
         self.init_ui()
 
+        # Loader animation ticks on the GUI thread — no extra thread needed
+        self._anim_timer = QTimer(self)
+        self._anim_timer.timeout.connect(self.loader.next_frame)
+
+        QThreadPool.globalInstance().start(KernelLoadRunnable())
+        QThreadPool.globalInstance().start(CachePruneRunnable())
+
     def init_ui(self):
-        self.setStyleSheet("QWidget { background-color: #f5f7fb; font-family: Segoe UI; }")
+        self.setStyleSheet(GLOBAL_QSS)
 
         # ================= SIDEBAR =================
         self.sidebar = QFrame()
         self.sidebar.setFixedWidth(300)
         self.sidebar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
-        self.sidebar.setStyleSheet("""
-            QFrame { background-color: #1f2937; }
-            QLabel { color: #e5e7eb; background: transparent; }
-        """)
+        self.sidebar.setObjectName("sidebar")
 
         sl = QVBoxLayout()
         sl.setContentsMargins(20, 30, 20, 20)
@@ -167,24 +573,24 @@ class UTFValidatorApp(QWidget):
 
         # Title
         title = QLabel("🔤  UTF Validator")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: white; background: transparent;")
+        title.setObjectName("appTitle")
         sl.addWidget(title)
         sl.addSpacing(4)
         subtitle = QLabel("Encoding Detection Tool")
-        subtitle.setStyleSheet("font-size: 11px; color: #6b7280; background: transparent;")
+        subtitle.setObjectName("appSubtitle")
         sl.addWidget(subtitle)
         sl.addSpacing(24)
 
         def divider():
             d = QFrame(); d.setFrameShape(QFrame.HLine)
-            d.setStyleSheet("background-color: #374151; max-height: 1px; margin: 0px;")
+            d.setObjectName("divider")
             return d
 
         sl.addWidget(divider())
         sl.addSpacing(18)
 
         section = QLabel("INPUT SOURCE")
-        section.setStyleSheet("font-size: 10px; color: #6b7280; letter-spacing: 2px; background: transparent;")
+        section.setObjectName("sectionLabel")
         sl.addWidget(section)
         sl.addSpacing(12)
 
@@ -192,26 +598,11 @@ class UTFValidatorApp(QWidget):
         self.file_btn = QPushButton()
         self.file_btn.setFixedHeight(100)
         self.file_btn.setText("📄   Select a File")
-        self.file_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #374151;
-                color: white;
-                border-radius: 12px;
-                font-size: 15px;
-                font-weight: bold;
-                text-align: center;
-                padding: 18px;
-                border: 2px solid transparent;
-            }
-            QPushButton:hover {
-                background-color: #4b5563;
-                border: 2px solid #60a5fa;
-            }
-        """)
+        self.file_btn.setObjectName("sourceBtn")
         self.file_btn.clicked.connect(self.select_file)
 
         self.file_label = QLabel("No file selected")
-        self.file_label.setStyleSheet("font-size: 11px; color: #6b7280; padding-left: 6px; background: transparent;")
+        self.file_label.setObjectName("sourceLabel")
         self.file_label.setWordWrap(True)
 
         sl.addWidget(self.file_btn)
@@ -223,29 +614,14 @@ class UTFValidatorApp(QWidget):
         self.folder_btn = QPushButton()
         self.folder_btn.setFixedHeight(100)
         self.folder_btn.setText("📁   Select a Folder")
-        self.folder_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #374151;
-                color: white;
-                border-radius: 12px;
-                font-size: 15px;
-                font-weight: bold;
-                text-align: center;
-                padding: 18px;
-                border: 2px solid transparent;
-            }
-            QPushButton:hover {
-                background-color: #4b5563;
-                border: 2px solid #60a5fa;
-            }
-        """)
+        self.folder_btn.setObjectName("sourceBtn")
         self.folder_btn.clicked.connect(self.select_folder)
 
         self.folder_label = QLabel("No folder selected")
-        self.folder_label.setStyleSheet("font-size: 11px; color: #6b7280; padding-left: 6px; background: transparent;")
+        self.folder_label.setObjectName("sourceLabel")
         self.folder_label.setWordWrap(True)
         self.folder_count_label = QLabel("")
-        self.folder_count_label.setStyleSheet("font-size: 11px; color: #60a5fa; padding-left: 6px; background: transparent;")
+        self.folder_count_label.setObjectName("folderCount")
 
         sl.addWidget(self.folder_btn)
         sl.addSpacing(6)
@@ -258,16 +634,7 @@ class UTFValidatorApp(QWidget):
         # --- Scan Button ---
         self.scan_btn = QPushButton("🚀  Start Scan")
         self.scan_btn.setFixedHeight(72)
-        self.scan_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2563eb; color: white;
-                padding: 14px; border-radius: 12px;
-                font-size: 18px; font-weight: bold;
-                border: 2px solid transparent;
-            }
-            QPushButton:hover    { background-color: #1d4ed8; border: 2px solid #93c5fd; }
-            QPushButton:disabled { background-color: #374151; color: #6b7280; border: none; }
-        """)
+        self.scan_btn.setObjectName("scanBtn")
         self.scan_btn.clicked.connect(self.start_scan)
         sl.addWidget(self.scan_btn)
         sl.addSpacing(10)
@@ -275,14 +642,7 @@ class UTFValidatorApp(QWidget):
         # --- Clear Button ---
         self.clear_btn = QPushButton("🗑  Clear Results")
         self.clear_btn.setFixedHeight(58)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent; color: #9ca3af;
-                border-radius: 10px; font-size: 14px;
-                border: 2px solid #374151;
-            }
-            QPushButton:hover { background-color: #374151; color: white; border: 2px solid #4b5563; }
-        """)
+        self.clear_btn.setObjectName("clearBtn")
         self.clear_btn.clicked.connect(self.clear_results)
         sl.addWidget(self.clear_btn)
 
@@ -291,7 +651,7 @@ class UTFValidatorApp(QWidget):
 
         # --- Scan Complete Indicator ---
         self.scan_complete_widget = QFrame()
-        self.scan_complete_widget.setStyleSheet("QFrame { background: transparent; } QLabel { background: transparent; }")
+        self.scan_complete_widget.setObjectName("scanComplete")
         sc_layout = QVBoxLayout()
         sc_layout.setContentsMargins(10, 15, 10, 15)
         sc_layout.setSpacing(6)
@@ -299,12 +659,12 @@ class UTFValidatorApp(QWidget):
 
         sc_emoji = QLabel("✅")
         sc_emoji.setAlignment(Qt.AlignCenter)
-        sc_emoji.setStyleSheet("font-size: 48px; background: transparent;")
+        sc_emoji.setObjectName("bigEmoji")
         sc_layout.addWidget(sc_emoji)
 
         sc_title = QLabel("Scan Complete!")
         sc_title.setAlignment(Qt.AlignCenter)
-        sc_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #10b981; background: transparent;")
+        sc_title.setObjectName("scanCompleteTitle")
         sc_layout.addWidget(sc_title)
 
         self.scan_complete_widget.setLayout(sc_layout)
@@ -316,33 +676,19 @@ class UTFValidatorApp(QWidget):
 
         # --- Export Buttons (shown after scan) ---
         self.export_widget = QFrame()
-        self.export_widget.setStyleSheet("QFrame { background: transparent; }")
+        self.export_widget.setObjectName("exportPanel")
         ex_layout = QVBoxLayout()
         ex_layout.setContentsMargins(0, 8, 0, 0)
         ex_layout.setSpacing(8)
 
         self.export_csv_btn = QPushButton("📄  Export as CSV")
         self.export_csv_btn.setFixedHeight(56)
-        self.export_csv_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95B9C7; color: white;
-                border-radius: 10px; font-size: 14px; font-weight: bold;
-                border: 2px solid #10b981;
-            }
-            QPushButton:hover { background-color: #047857; }
-        """)
+        self.export_csv_btn.setObjectName("exportCsvBtn")
         self.export_csv_btn.clicked.connect(self.export_csv)
 
         self.export_pdf_btn = QPushButton("📑  Export as PDF")
         self.export_pdf_btn.setFixedHeight(56)
-        self.export_pdf_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1e3a5f; color: white;
-                border-radius: 10px; font-size: 14px; font-weight: bold;
-                border: 2px solid #3b82f6;
-            }
-            QPushButton:hover { background-color: #1d4ed8; }
-        """)
+        self.export_pdf_btn.setObjectName("exportPdfBtn")
         self.export_pdf_btn.clicked.connect(self.export_pdf)
 
         ex_layout.addWidget(self.export_csv_btn)
@@ -358,7 +704,7 @@ class UTFValidatorApp(QWidget):
         sl.addStretch()
 
         footer = QLabel("Powered by validator.py")
-        footer.setStyleSheet("font-size: 10px; color: #374151; background: transparent;")
+        footer.setObjectName("footer")
         footer.setAlignment(Qt.AlignCenter)
         sl.addWidget(footer)
 
@@ -367,7 +713,7 @@ class UTFValidatorApp(QWidget):
         # ================= CONTENT =================
         self.content = QFrame()
         self.content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.content.setStyleSheet("background-color: #f5f7fb;")
+        self.content.setObjectName("content")
 
         cl = QVBoxLayout()
         cl.setContentsMargins(30, 30, 30, 30)
@@ -377,47 +723,46 @@ class UTFValidatorApp(QWidget):
         hl = QHBoxLayout()
         hv = QVBoxLayout()
         pt = QLabel("Scan Results")
-        pt.setStyleSheet("font-size: 22px; font-weight: bold; color: #1f2937;")
+        pt.setObjectName("pageTitle")
         ps = QLabel("Analyze file encoding across your project")
-        ps.setStyleSheet("font-size: 13px; color: #6b7280;")
+        ps.setObjectName("pageSubtitle")
         hv.addWidget(pt); hv.addWidget(ps)
         hl.addLayout(hv); hl.addStretch()
         cl.addLayout(hl)
 
-        # 5 Summary Cards
+        # 6 Summary Cards
         card_row = QHBoxLayout()
         card_row.setSpacing(15)
-        self.total_card   = self.create_card("Total Files",       "0", "#3b82f6", "📊")
-        self.utf_card     = self.create_card("100% UTF",          "0", "#10b981", "✅")
-        self.mixed_card   = self.create_card("Mostly UTF (≥90%)", "0", "#f59e0b", "🔶")
-        self.non_utf_card = self.create_card("Non-UTF (<90%)",    "0", "#ef4444", "⚠️")
-        self.binary_card  = self.create_card("Binary Files",      "0", "#8b5cf6", "📦")
+        self.total_card   = self.create_card("Total Files",       "0", "card-total",  "📊")
+        self.utf_card     = self.create_card("100% UTF",          "0", "card-utf",    "✅")
+        self.mixed_card   = self.create_card("Mostly UTF (≥90%)", "0", "card-mixed",  "🔶")
+        self.non_utf_card = self.create_card("Non-UTF (<90%)",    "0", "card-nonutf", "⚠️")
+        self.binary_card  = self.create_card("Binary Files",      "0", "card-binary", "📦")
+        self.skipped_card = self.create_card("Skipped (too large)", "0", "card-skipped", "⏭️")
         card_row.addWidget(self.total_card)
         card_row.addWidget(self.utf_card)
         card_row.addWidget(self.mixed_card)
         card_row.addWidget(self.non_utf_card)
         card_row.addWidget(self.binary_card)
+        card_row.addWidget(self.skipped_card)
         cl.addLayout(card_row)
 
         # Average UTF bar
         avg_frame = QFrame()
-        avg_frame.setStyleSheet("background: white; border-radius: 12px;")
+        avg_frame.setObjectName("avgFrame")
         avg_row = QHBoxLayout()
         avg_row.setContentsMargins(20, 12, 20, 12)
         avg_row.setSpacing(15)
         avg_lbl = QLabel("Average UTF Coverage across all files:")
-        avg_lbl.setStyleSheet("font-size: 13px; color: #374151; font-weight: bold;")
+        avg_lbl.setObjectName("avgLabel")
         self.avg_bar = QProgressBar()
         self.avg_bar.setRange(0, 100)
         self.avg_bar.setValue(0)
         self.avg_bar.setFixedHeight(18)
         self.avg_bar.setTextVisible(False)
-        self.avg_bar.setStyleSheet("""
-            QProgressBar { background-color: #f3f4f6; border-radius: 9px; border: none; }
-            QProgressBar::chunk { background-color: #10b981; border-radius: 9px; }
-        """)
+        self.avg_bar.setObjectName("avgBar")
         self.avg_pct_label = QLabel("0%")
-        self.avg_pct_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #10b981; min-width: 45px;")
+        self.avg_pct_label.setObjectName("avgPct")
         self.avg_pct_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         avg_row.addWidget(avg_lbl)
         avg_row.addWidget(self.avg_bar, 1)
@@ -429,10 +774,7 @@ class UTFValidatorApp(QWidget):
         self.progress = QProgressBar()
         self.progress.setRange(0, 0)
         self.progress.setFixedHeight(6)
-        self.progress.setStyleSheet("""
-            QProgressBar { background-color: #e5e7eb; border-radius: 3px; border: none; }
-            QProgressBar::chunk { background-color: #3b82f6; border-radius: 3px; }
-        """)
+        self.progress.setObjectName("scanProgress")
         self.progress.hide()
         cl.addWidget(self.progress)
 
@@ -441,43 +783,43 @@ class UTFValidatorApp(QWidget):
         bottom.setSpacing(20)
 
         chart_card = QFrame()
-        chart_card.setStyleSheet("background: white; border-radius: 15px;")
+        chart_card.setObjectName("panel")
         chart_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         chart_l = QVBoxLayout()
         chart_l.setContentsMargins(20, 20, 20, 20)
         chart_title_lbl = QLabel("Encoding Distribution")
-        chart_title_lbl.setStyleSheet("font-size: 14px; font-weight: bold; color: #1f2937;")
+        chart_title_lbl.setObjectName("panelTitle")
         chart_l.addWidget(chart_title_lbl)
-        self.figure = Figure()
-        self.figure.patch.set_facecolor('white')
-        self.canvas = FigureCanvas(self.figure)
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        chart_l.addWidget(self.canvas)
+        # matplotlib is only imported once there is something to chart (_ensure_chart)
+        self.figure = None
+        self.canvas = None
+        self.ax     = None
+        self._chart_placeholder = QLabel("No scan yet")
+        self._chart_placeholder.setObjectName("chartPlaceholder")
+        self._chart_placeholder.setAlignment(Qt.AlignCenter)
+        self._chart_placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        chart_l.addWidget(self._chart_placeholder)
+        self._chart_layout = chart_l
         chart_card.setLayout(chart_l)
 
         results_card = QFrame()
-        results_card.setStyleSheet("background: white; border-radius: 15px;")
+        results_card.setObjectName("panel")
         results_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         res_l = QVBoxLayout()
         res_l.setContentsMargins(20, 20, 20, 20)
         res_title = QLabel("File Results")
-        res_title.setStyleSheet("font-size: 14px; font-weight: bold; color: #1f2937; margin-bottom: 10px;")
+        res_title.setObjectName("resultsTitle")
         res_l.addWidget(res_title)
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("""
-            QScrollArea { border: none; background: transparent; }
-            QScrollBar:vertical { background: #f3f4f6; width: 8px; border-radius: 4px; }
-            QScrollBar::handle:vertical { background: #d1d5db; border-radius: 4px; }
-        """)
-        self.result_container = QWidget()
-        self.result_container.setStyleSheet("background: transparent;")
-        self.result_layout = QVBoxLayout()
-        self.result_layout.setSpacing(10)
-        self.result_layout.setAlignment(Qt.AlignTop)
-        self.result_container.setLayout(self.result_layout)
-        self.scroll.setWidget(self.result_container)
-        res_l.addWidget(self.scroll)
+        # Virtualized list — cards are painted by the delegate, only for visible rows
+        self.model = ResultsModel(self)
+        self.results_view = QListView()
+        self.results_view.setModel(self.model)
+        self.results_view.setItemDelegate(ResultCardDelegate(self.results_view))
+        self.results_view.setSelectionMode(QListView.NoSelection)
+        self.results_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.results_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.results_view.setObjectName("resultsView")
+        res_l.addWidget(self.results_view)
         results_card.setLayout(res_l)
 
         bottom.addWidget(chart_card, 2)
@@ -492,27 +834,24 @@ class UTFValidatorApp(QWidget):
         main_layout.addWidget(self.content)
 
     # ---------- Card Creator ----------
-    def create_card(self, title, value, color, icon=""):
+    def create_card(self, title, value, name, icon=""):
         card = QFrame()
+        card.setObjectName(name)
         card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         card.setMinimumHeight(110)
-        card.setStyleSheet(f"""
-            QFrame {{ background-color: {color}; border-radius: 15px; }}
-            QLabel {{ color: white; background: transparent; }}
-        """)
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 15, 20, 15)
         layout.setAlignment(Qt.AlignVCenter)
         top = QHBoxLayout()
         icon_lbl = QLabel(icon)
-        icon_lbl.setStyleSheet("font-size: 22px; background: transparent;")
+        icon_lbl.setObjectName("cardIcon")
         top.addWidget(icon_lbl); top.addStretch()
         layout.addLayout(top)
         val_lbl = QLabel(value)
-        val_lbl.setStyleSheet("font-size: 32px; font-weight: bold; color: white; background: transparent;")
+        val_lbl.setObjectName("cardValue")
         layout.addWidget(val_lbl)
         ttl_lbl = QLabel(title)
-        ttl_lbl.setStyleSheet("font-size: 11px; color: rgba(255,255,255,0.85); background: transparent;")
+        ttl_lbl.setObjectName("cardTitle")
         layout.addWidget(ttl_lbl)
         card.setLayout(layout)
         card.value_label = val_lbl
@@ -525,29 +864,9 @@ class UTFValidatorApp(QWidget):
             self.selected_file   = file
             self.selected_folder = None
             self.file_label.setText(f"📄 {os.path.basename(file)}")
-            self.file_label.setStyleSheet("font-size: 11px; color: #60a5fa; padding-left: 6px; background: transparent;")
             self.folder_label.setText("No folder selected")
-            self.folder_label.setStyleSheet("font-size: 11px; color: #6b7280; padding-left: 6px; background: transparent;")
             self.folder_count_label.setText("")
-            # Highlight selected button
-            self.file_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #1e3a5f; color: white;
-                    border-radius: 12px; font-size: 14px; font-weight: bold;
-                    text-align: left; padding: 12px 16px;
-                    border: 2px solid #60a5fa;
-                }
-                QPushButton:hover { background-color: #1e3a5f; border: 2px solid #93c5fd; }
-            """)
-            self.folder_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #374151; color: white;
-                    border-radius: 12px; font-size: 14px; font-weight: bold;
-                    text-align: left; padding: 12px 16px;
-                    border: 2px solid transparent;
-                }
-                QPushButton:hover { background-color: #4b5563; border: 2px solid #60a5fa; }
-            """)
+            self._highlight_source(self.file_btn, self.file_label, self.folder_btn, self.folder_label)
             self.clear_results()
 
     # ---------- Select Folder ----------
@@ -557,47 +876,43 @@ class UTFValidatorApp(QWidget):
             self.selected_folder = folder
             self.selected_file   = None
             self.folder_label.setText(f"📁 {os.path.basename(folder)}")
-            self.folder_label.setStyleSheet("font-size: 11px; color: #60a5fa; padding-left: 6px; background: transparent;")
             self.file_label.setText("No file selected")
-            self.file_label.setStyleSheet("font-size: 11px; color: #6b7280; padding-left: 6px; background: transparent;")
-            count = sum(len(files) for _, _, files in os.walk(folder))
-            self.folder_count_label.setText(f"  {count} files found")
-            # Highlight selected button
-            self.folder_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #1e3a5f; color: white;
-                    border-radius: 12px; font-size: 14px; font-weight: bold;
-                    text-align: left; padding: 12px 16px;
-                    border: 2px solid #60a5fa;
-                }
-                QPushButton:hover { background-color: #1e3a5f; border: 2px solid #93c5fd; }
-            """)
-            self.file_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #374151; color: white;
-                    border-radius: 12px; font-size: 14px; font-weight: bold;
-                    text-align: left; padding: 12px 16px;
-                    border: 2px solid transparent;
-                }
-                QPushButton:hover { background-color: #4b5563; border: 2px solid #60a5fa; }
-            """)
+            self.folder_count_label.setText("  Counting…")
+            job = FolderCountRunnable(folder)
+            job.signals.finished.connect(self.show_folder_count)
+            self._folder_count_signals = job.signals
+            QThreadPool.globalInstance().start(job)
+            self._highlight_source(self.folder_btn, self.folder_label, self.file_btn, self.file_label)
             self.clear_results()
 
+    # ---------- Folder Count ----------
+    def show_folder_count(self, folder, count):
+        # Ignore counts for a folder that is no longer selected
+        if folder == self.selected_folder:
+            self.folder_count_label.setText(f"  {count} files found")
+
+    # ---------- Source Highlight ----------
+    def _highlight_source(self, active_btn, active_lbl, other_btn, other_lbl):
+        _restyle(active_btn, "selected", "true")
+        _restyle(active_lbl, "selected", "true")
+        _restyle(other_btn, "selected", "false")
+        _restyle(other_lbl, "selected", "false")
+
     # ---------- Clear Results ----------
     def clear_results(self):
-        while self.result_layout.count():
-            child = self.result_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.model.setResults([])
         self.total_card.value_label.setText("0")
         self.utf_card.value_label.setText("0")
         self.mixed_card.value_label.setText("0")
         self.non_utf_card.value_label.setText("0")
         self.binary_card.value_label.setText("0")
+        self.skipped_card.value_label.setText("0")
         self.avg_bar.setValue(0)
         self.avg_pct_label.setText("0%")
-        self.figure.clear()
-        self.canvas.draw()
+        if self.canvas is not None:
+            self.ax.clear()
+            self.ax.set_axis_off()
+            self.canvas.draw()
         self.scan_complete_widget.hide()
         if hasattr(self, 'export_widget'):
             self.export_widget.hide()
@@ -641,23 +956,45 @@ class UTFValidatorApp(QWidget):
         if hasattr(self, 'export_widget'):
             self.export_widget.hide()
         self._last_results = []
+
+        # A small single file scans in microseconds — not worth a thread and a
+        # signal hop. Bigger ones go to ScanThread so the window stays
+        # responsive, as does any scan while the JIT kernels are still loading.
+        # The cache is skipped: rescanning is cheaper than waiting on its lock
+        if (self.selected_file and not self.selected_folder
+                and kernels_loaded() and self._is_small(self.selected_file)):
+            info = scan_single_file(self.selected_file, cache=False)
+            info["filename"] = os.path.basename(self.selected_file)
+            info["file"]     = self.selected_file
+            self.display_results(_summarize([info]), [info])
+            return
+
         self.scan_btn.setEnabled(False)
         self.progress.show()
+        self.progress.setRange(0, 0)
         self.loader.start()
-
-        # Dedicated animation thread — sleeps 1 sec then emits tick
-        self._anim = AnimThread()
-        self._anim.tick.connect(self.loader.next_frame)
-        self._anim.start()
+        self._anim_timer.start(1000)
 
         self.thread = ScanThread(self.selected_file, self.selected_folder)
+        self.thread.progress_signal.connect(self.update_progress)
         self.thread.finished_signal.connect(self.display_results)
         self.thread.start()
 
+    @staticmethod
+    def _is_small(path):
+        try:
+            return os.path.getsize(path) < MMAP_THRESHOLD
+        except OSError:
+            return False   # ScanThread reports the error
+
+    # ---------- Scan Progress ----------
+    def update_progress(self, done, total):
+        self.progress.setRange(0, total)
+        self.progress.setValue(done)
+
     # ---------- Display Results ----------
-    def display_results(self, data):
-        self._anim.requestInterruption()
-        self._anim.wait()
+    def display_results(self, data, results=None):
+        self._anim_timer.stop()
         self.scan_btn.setEnabled(True)
         self.progress.hide()
         self.loader.stop()
@@ -669,159 +1006,61 @@ class UTFValidatorApp(QWidget):
         binary = data["binary"]
         self.scan_complete_widget.show()
         self.export_widget.show()
-        self._last_results = data["results"]
+        self._last_results = self.thread.results if results is None else results
+        self._cols = _columns(self._last_results)
 
         self.total_card.value_label.setText(str(data["total"]))
         self.utf_card.value_label.setText(str(data["utf"]))
         self.mixed_card.value_label.setText(str(data["mixed"]))
         self.non_utf_card.value_label.setText(str(data["non_utf"]))
         self.binary_card.value_label.setText(str(data["binary"]))
+        self.skipped_card.value_label.setText(str(data["skipped"]))
 
         avg = data["avg_utf_percent"]
         self.avg_bar.setValue(int(avg))
         self.avg_pct_label.setText(f"{avg}%")
-        chunk_color = "#10b981" if avg >= 90 else ("#f59e0b" if avg >= 50 else "#ef4444")
-        self.avg_bar.setStyleSheet(f"""
-            QProgressBar {{ background-color: #f3f4f6; border-radius: 9px; border: none; }}
-            QProgressBar::chunk {{ background-color: {chunk_color}; border-radius: 9px; }}
-        """)
-        self.avg_pct_label.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {chunk_color}; min-width: 45px;")
+        level = "good" if avg >= 90 else ("warn" if avg >= 50 else "bad")
+        _restyle(self.avg_bar, "level", level)
+        _restyle(self.avg_pct_label, "level", level)
 
-        for r in data["results"]:
-            self.result_layout.addWidget(self.create_result_card(r))
+        self.model.setResults(self._last_results)
 
         # Donut chart
-        self.figure.clear()
-        values = [data["utf"], data["mixed"], data["non_utf"], data["binary"]]
-        labels = ["100% UTF", "Mostly UTF", "Non-UTF", "Binary"]
-        colors = ["#10b981", "#f59e0b", "#ef4444", "#8b5cf6"]
-        filtered = [(v, l, c) for v, l, c in zip(values, labels, colors) if v > 0]
-        if filtered:
-            v, l, c = zip(*filtered)
-            ax = self.figure.add_subplot(111)
-            wedges, texts, autotexts = ax.pie(
+        self._ensure_chart()
+        self.ax.clear()
+        self.ax.set_axis_off()
+        shown = [i for i, key in enumerate(CHART_KEYS) if data[key] > 0]
+        if shown:
+            v = [data[CHART_KEYS[i]] for i in shown]
+            l = [CHART_LABELS[i] for i in shown]
+            c = [CHART_COLORS[i] for i in shown]
+            wedges, texts, autotexts = self.ax.pie(
                 v, labels=l, autopct='%1.1f%%', colors=c,
                 startangle=90, wedgeprops=dict(width=0.6)
             )
             for text in texts: text.set_fontsize(10)
             for at in autotexts:
                 at.set_fontsize(9); at.set_color('white'); at.set_fontweight('bold')
-            ax.set_title("Encoding Distribution", fontsize=13, fontweight='bold', pad=15)
+            self.ax.set_title("Encoding Distribution", fontsize=13, fontweight='bold', pad=15)
         self.canvas.draw()
 
-    # ---------- Result Card ----------
-    def create_result_card(self, r):
-        utf_pct     = r.get("utf_percent", 0.0)
-        non_utf_pct = r.get("non_utf_percent", 0.0)
-        is_binary   = r.get("is_binary", False)
-        is_utf      = r.get("is_utf", False)
-        is_mostly   = r.get("is_mostly_utf", False)
-
-        if is_binary:
-            border_color = "#8b5cf6"; bg_color = "#f5f3ff"
-            tag_text = "📦 Binary";    tag_color = "#8b5cf6"; bar_color = "#8b5cf6"
-        elif is_utf:
-            border_color = "#10b981"; bg_color = "#ecfdf5"
-            tag_text = "✅ 100% UTF";  tag_color = "#10b981"; bar_color = "#10b981"
-        elif is_mostly:
-            border_color = "#f59e0b"; bg_color = "#fffbeb"
-            tag_text = "🔶 Mostly UTF"; tag_color = "#f59e0b"; bar_color = "#f59e0b"
-        else:
-            border_color = "#ef4444"; bg_color = "#fef2f2"
-            tag_text = "⚠️ Non-UTF";   tag_color = "#ef4444"; bar_color = "#ef4444"
-
-        card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{ background: {bg_color}; border-left: 4px solid {border_color}; border-radius: 8px; }}
-            QLabel {{ background: transparent; color: #1f2937; }}
-        """)
-
-        outer = QVBoxLayout()
-        outer.setContentsMargins(15, 10, 15, 10)
-        outer.setSpacing(6)
-
-        # Top row
-        top_row = QHBoxLayout()
-        fname = QLabel(r.get("filename", "Unknown"))
-        fname.setStyleSheet("font-weight: bold; font-size: 13px;")
-        tag = QLabel(tag_text)
-        tag.setStyleSheet(f"""
-            background-color: {tag_color}; color: white;
-            border-radius: 6px; padding: 3px 10px;
-            font-size: 11px; font-weight: bold;
-        """)
-        tag.setFixedHeight(24)
-        top_row.addWidget(fname); top_row.addStretch(); top_row.addWidget(tag)
-        outer.addLayout(top_row)
-
-        if is_binary:
-            info_lbl = QLabel("Binary file — encoding check not applicable")
-            info_lbl.setStyleSheet("font-size: 11px; color: #8b5cf6;")
-            outer.addWidget(info_lbl)
-        else:
-            total_chars   = r.get("total_chars", 0)
-            non_utf_chars = r.get("non_utf_chars", 0)
-            detected_enc  = r.get("detected_encoding", "Unknown")
-
-            content_row = QHBoxLayout()
-            content_row.setSpacing(15)
-
-            left = QVBoxLayout()
-            left.setSpacing(5)
-
-            enc_lbl = QLabel(f"Detected encoding: {detected_enc}")
-            enc_lbl.setStyleSheet(f"font-size: 11px; font-weight: bold; color: {border_color};")
-            left.addWidget(enc_lbl)
-
-            stats = QLabel(
-                f"Total chars: {total_chars:,}  •  Invalid chars: {non_utf_chars:,}  •  "
-                f"UTF: {utf_pct}%  |  Non-UTF: {non_utf_pct}%"
-            )
-            stats.setStyleSheet("font-size: 11px; color: #6b7280;")
-            left.addWidget(stats)
-
-            bar_row = QHBoxLayout()
-            bar_row.setSpacing(8)
-            lbl = QLabel("UTF")
-            lbl.setStyleSheet(f"font-size: 10px; color: {bar_color}; font-weight: bold; min-width: 28px;")
-            bar = QProgressBar()
-            bar.setRange(0, 100); bar.setValue(int(utf_pct))
-            bar.setFixedHeight(10); bar.setTextVisible(False)
-            bar.setStyleSheet(f"""
-                QProgressBar {{ background-color: #f3f4f6; border-radius: 5px; border: none; }}
-                QProgressBar::chunk {{ background-color: {bar_color}; border-radius: 5px; }}
-            """)
-            pct = QLabel(f"{utf_pct}%")
-            pct.setStyleSheet(f"font-size: 11px; font-weight: bold; color: {bar_color}; min-width: 40px;")
-            pct.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            bar_row.addWidget(lbl); bar_row.addWidget(bar, 1); bar_row.addWidget(pct)
-            left.addLayout(bar_row)
-            content_row.addLayout(left, 1)
-
-            # Mini pie chart for non-utf / mostly-utf
-            if not is_utf:
-                mini_fig = Figure(figsize=(1.5, 1.5), facecolor="none")
-                mini_fig.patch.set_alpha(0)
-                mini_canvas = FigureCanvas(mini_fig)
-                mini_canvas.setFixedSize(110, 110)
-                mini_canvas.setStyleSheet("background: transparent;")
-                ax = mini_fig.add_subplot(111)
-                ax.pie(
-                    [utf_pct, non_utf_pct],
-                    colors=[bar_color, "#e5e7eb"],
-                    startangle=90,
-                    wedgeprops=dict(width=0.5),
-                )
-                ax.text(0, 0, f"{utf_pct}%", ha="center", va="center",
-                        fontsize=8, fontweight="bold", color=bar_color)
-                mini_fig.tight_layout(pad=0)
-                content_row.addWidget(mini_canvas)
-
-            outer.addLayout(content_row)
-
-        card.setLayout(outer)
-        return card
+    # ---------- Chart ----------
+    def _ensure_chart(self):
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
 
+        self.figure = Figure()
+        self.figure.patch.set_facecolor('white')
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # One Axes for the lifetime of the window; renders only clear it
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_axis_off()
+        self._chart_layout.replaceWidget(self._chart_placeholder, self.canvas)
+        self._chart_placeholder.deleteLater()
+        self._chart_placeholder = None
 
     # ---------- Export CSV ----------
     def export_csv(self):
@@ -831,27 +1070,23 @@ class UTFValidatorApp(QWidget):
         if not path:
             return
         try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Filename", "Status", "Detected Encoding", "Total Chars", "Invalid Chars", "UTF %", "Non-UTF %"])
-                for r in self._last_results:
-                    if r.get("is_binary"):
-                        status = "Binary"
-                    elif r.get("is_utf"):
-                        status = "100% UTF"
-                    elif r.get("is_mostly_utf"):
-                        status = "Mostly UTF"
-                    else:
-                        status = "Non-UTF"
-                    writer.writerow([
-                        r.get("filename", ""),
-                        status,
-                        r.get("detected_encoding", ""),
-                        r.get("total_chars", 0),
-                        r.get("non_utf_chars", 0),
-                        r.get("utf_percent", 0),
-                        r.get("non_utf_percent", 0),
-                    ])
+            # Build the report in memory and write it in one go, rather
+            # than one small write per row
+            buf    = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(["Filename", "Status", "Detected Encoding", "Total Chars", "Invalid Chars", "UTF %", "Non-UTF %"])
+            cols = self._cols
+            writer.writerows(zip(
+                cols["filename"],
+                map(STATUS_LABELS.__getitem__, cols["status"]),
+                cols["detected_encoding"],
+                cols["total_chars"],
+                cols["non_utf_chars"],
+                cols["utf_percent"],
+                cols["non_utf_percent"],
+            ))
+            with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(buf.getvalue())
             msg = QMessageBox(self)
             msg.setWindowTitle("Export Successful")
             msg.setText("Your CSV report is ready!")
@@ -879,7 +1114,7 @@ class UTFValidatorApp(QWidget):
             from reportlab.lib import colors
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import cm
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
             from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
             doc = SimpleDocTemplate(path, pagesize=A4,
@@ -897,17 +1132,20 @@ class UTFValidatorApp(QWidget):
             story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}", sub_style))
 
             # Summary counts
+            cols    = self._cols
+            counts  = np.bincount(np.frombuffer(cols["status"], dtype=np.int8), minlength=len(STATUS_LABELS))
             total   = len(self._last_results)
-            utf     = sum(1 for r in self._last_results if r.get("is_utf"))
-            mostly  = sum(1 for r in self._last_results if r.get("is_mostly_utf"))
-            non_utf = sum(1 for r in self._last_results if not r.get("is_utf") and not r.get("is_mostly_utf") and not r.get("is_binary"))
-            binary  = sum(1 for r in self._last_results if r.get("is_binary"))
+            utf     = counts[CAT_UTF]
+            mostly  = counts[CAT_UTF] + counts[CAT_MOSTLY]   # every 100% UTF file is also mostly UTF
+            non_utf = counts[CAT_NON_UTF]
+            binary  = counts[CAT_BINARY]
+            skipped = counts[CAT_SKIPPED]
 
             summary_data = [
-                ["Total Files", "100% UTF", "Mostly UTF", "Non-UTF", "Binary"],
-                [str(total), str(utf), str(mostly), str(non_utf), str(binary)],
+                ["Total Files", "100% UTF", "Mostly UTF", "Non-UTF", "Binary", "Skipped"],
+                [str(total), str(utf), str(mostly), str(non_utf), str(binary), str(skipped)],
             ]
-            summary_table = Table(summary_data, colWidths=[3.5*cm]*5)
+            summary_table = Table(summary_data, colWidths=[2.9*cm]*6)
             summary_table.setStyle(TableStyle([
                 ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#1f2937")),
                 ("TEXTCOLOR",  (0,0), (-1,0), colors.white),
@@ -916,6 +1154,7 @@ class UTFValidatorApp(QWidget):
                 ("BACKGROUND", (2,1), (2,1),  colors.HexColor("#f59e0b")),
                 ("BACKGROUND", (3,1), (3,1),  colors.HexColor("#ef4444")),
                 ("BACKGROUND", (4,1), (4,1),  colors.HexColor("#8b5cf6")),
+                ("BACKGROUND", (5,1), (5,1),  colors.HexColor("#6b7280")),
                 ("TEXTCOLOR",  (0,1), (-1,1), colors.white),
                 ("FONTNAME",   (0,0), (-1,-1), "Helvetica-Bold"),
                 ("FONTSIZE",   (0,0), (-1,-1), 11),
@@ -934,27 +1173,19 @@ class UTFValidatorApp(QWidget):
                                         textColor=colors.HexColor("#1f2937"), spaceAfter=10)
             story.append(Paragraph("File Results", head_style))
 
+            # Format each column in one pass, then zip the rows together
+            names   = [name[:35] for name in cols["filename"]]
+            encs    = [enc[:15] for enc in cols["detected_encoding"]]
+            totals  = [f"{n:,}" for n in cols["total_chars"]]
+            invalid = [f"{n:,}" for n in cols["non_utf_chars"]]
+            pcts    = [f"{p}%" for p in cols["utf_percent"]]
             table_data = [["Filename", "Status", "Encoding", "Total Chars", "Invalid", "UTF %"]]
-            for r in self._last_results:
-                if r.get("is_binary"):
-                    status = "Binary"
-                elif r.get("is_utf"):
-                    status = "100% UTF"
-                elif r.get("is_mostly_utf"):
-                    status = "Mostly UTF"
-                else:
-                    status = "Non-UTF"
-                table_data.append([
-                    r.get("filename", "")[:35],
-                    status,
-                    r.get("detected_encoding", "")[:15],
-                    f'{r.get("total_chars", 0):,}',
-                    f'{r.get("non_utf_chars", 0):,}',
-                    f'{r.get("utf_percent", 0)}%',
-                ])
+            table_data += map(list, zip(
+                names, map(STATUS_LABELS.__getitem__, cols["status"]), encs, totals, invalid, pcts))
 
             col_widths = [6*cm, 2.5*cm, 3*cm, 2.5*cm, 2*cm, 1.8*cm]
-            file_table = Table(table_data, colWidths=col_widths, repeatRows=1)
+            # LongTable splits across pages without re-measuring the whole table each time
+            file_table = LongTable(table_data, colWidths=col_widths, repeatRows=1)
 
             row_styles = [
                 ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#1f2937")),
@@ -967,17 +1198,18 @@ class UTFValidatorApp(QWidget):
                 ("ROWHEIGHT",  (0,0), (-1,-1), 20),
                 ("INNERGRID",  (0,0), (-1,-1), 0.3, colors.HexColor("#e5e7eb")),
                 ("BOX",        (0,0), (-1,-1), 0.5, colors.HexColor("#d1d5db")),
+                # Striped filename column
+                ("ROWBACKGROUNDS", (0,1), (0,-1), [colors.HexColor("#f9fafb"), colors.white]),
             ]
-            # Color status column rows
-            status_colors = {"100% UTF": "#d1fae5", "Mostly UTF": "#fef3c7", "Non-UTF": "#fee2e2", "Binary": "#ede9fe"}
-            for i, r in enumerate(self._last_results, start=1):
-                if r.get("is_binary"):    s = "Binary"
-                elif r.get("is_utf"):     s = "100% UTF"
-                elif r.get("is_mostly_utf"): s = "Mostly UTF"
-                else: s = "Non-UTF"
-                bg = status_colors.get(s, "#ffffff")
-                row_styles.append(("BACKGROUND", (1,i), (1,i), colors.HexColor(bg)))
-                row_styles.append(("BACKGROUND", (0,i), (0,i), colors.white if i%2==0 else colors.HexColor("#f9fafb")))
+            # Color status column rows, one command per run of equal statuses
+            status_colors = {s: colors.HexColor(c) for s, c in (
+                ("100% UTF", "#d1fae5"), ("Mostly UTF", "#fef3c7"), ("Non-UTF", "#fee2e2"), ("Binary", "#ede9fe"),
+                ("Skipped", "#f3f4f6"))}
+            i = 1
+            for cat, run in groupby(cols["status"]):
+                n = sum(1 for _ in run)
+                row_styles.append(("BACKGROUND", (1,i), (1,i+n-1), status_colors[STATUS_LABELS[cat]]))
+                i += n
 
             file_table.setStyle(TableStyle(row_styles))
             story.append(file_table)
@@ -1,14 +1,234 @@
 # validator.py
+import codecs
+import functools
+import importlib.util
+import json
+import mmap
 import os
-import chardet
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 
-BINARY_EXTENSIONS = (
+# cchardet (or its maintained fork faust-cchardet, same module name) is a
+# C++ port of chardet and much faster on large inputs
+try:
+    import cchardet as _chardet
+except ImportError:
+    import chardet as _chardet
+
+# Optional JIT for the DFA validator; the strict decode is the fallback.
+# Importing numba takes longer than the rest of start-up, so only check
+# that it is installed here; _lazy_njit imports it on first use.
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# A frozenset, since it is checked once per scanned file
+BINARY_EXTENSIONS = frozenset({
     ".pdf", ".xls", ".xlsx", ".doc", ".docx", ".ppt", ".pptx",
     ".zip", ".rar", ".exe", ".png", ".jpg", ".jpeg", ".gif",
     ".mp3", ".mp4", ".avi", ".mkv", ".wav", ".bmp", ".ico",
-    ".db", ".sqlite", ".pyc", ".class"
+    ".db", ".sqlite", ".pyc", ".class", ".gz", ".dll", ".so",
+    ".o", ".a"
+})
+
+# Folder scans never descend into these directories
+SKIP_DIRS = frozenset({".git", "__pycache__"})
+
+# Text files essentially never contain NUL bytes; above this share of the
+# first chunk a file is treated as binary whatever its extension
+BINARY_NUL_RATIO = 0.1
+
+# Signatures of common binary formats, checked against the first bytes
+# so a mislabeled archive or image is rejected without decoding it
+_BINARY_MAGIC = (
+    b"PK\x03\x04",        # zip, docx, xlsx, jar
+    b"%PDF",
+    b"\x89PNG",
+    b"\x1f\x8b\x08",      # gzip
+    b"\x7fELF",
+    b"\xff\xd8\xff",      # JPEG
 )
 
+# UTF-16/32 byte order marks (FF FE also covers UTF-32 LE). Text in these
+# encodings is NUL-heavy, so files starting with one skip the NUL check
+# and are labelled by chardet instead
+_WIDE_BOMS = (b"\xff\xfe", b"\xfe\xff", b"\x00\x00\xfe\xff")
+
+# Below this many files to read, starting worker processes costs more than
+# it saves; scan_files reads them on a few threads instead
+POOL_MIN_FILES = 32
+
+# Files are streamed through ValidatorState in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
+# Files at least this big are memory-mapped instead of being read
+# chunk by chunk
+MMAP_THRESHOLD = 1024 * 1024
+
+# Files larger than this are reported as skipped instead of being read.
+# Memory stays bounded whatever the size, but a multi-GB dump would hold
+# up the scan for little use
+MAX_FILE_SIZE = 1024 * 1024 * 1024
+
+# scan_bytes checks its input a slice of about this size at a time, so its
+# NumPy temporaries and the mapped pages it holds stay this small
+SCAN_SLICE_SIZE = 4 * 1024 * 1024
+
+# chardet sees the first DETECT_SAMPLE_SIZE bytes, the last
+# DETECT_TAIL_SIZE and DETECT_WINDOW_SIZE bytes around the first invalid
+# byte, so detection cost doesn't grow with the file
+DETECT_SAMPLE_SIZE = 64 * 1024
+DETECT_TAIL_SIZE   = 4 * 1024
+DETECT_WINDOW_SIZE = 4 * 1024
+
+# The sample is fed to chardet in pieces of this size
+DETECT_FEED_SIZE = 16 * 1024
+
+# Björn Höhrmann's UTF-8 DFA. The first 256 entries map a byte to its
+# character class, the other 108 map (state + class) to the next state.
+# State 0 accepts, state 12 rejects.
+_UTF8_DFA = np.array([
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    8, 8, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    10, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 11, 6, 6, 6, 5, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    0, 12, 24, 36, 60, 96, 84, 12, 12, 12, 48, 72, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+    12, 0, 12, 12, 12, 12, 12, 0, 12, 0, 12, 12, 12, 24, 12, 12, 12, 12, 12, 24, 12, 24, 12, 12,
+    12, 12, 12, 12, 12, 12, 12, 24, 12, 12, 12, 12, 12, 24, 12, 12, 12, 12, 12, 12, 12, 24, 12, 12,
+    12, 12, 12, 12, 12, 12, 12, 36, 12, 36, 12, 12, 12, 36, 12, 12, 12, 12, 12, 36, 12, 36, 12, 12,
+    12, 36, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+], dtype=np.uint8)
+
+
+_UTF8_CLASS = _UTF8_DFA[:256].astype(np.int32)
+_UTF8_TRANS = _UTF8_DFA[256:].astype(np.int32)
+
+
+def _dfa_validate(arr):
+    """True if the uint8 array is valid UTF-8 — one table lookup per non-ASCII byte."""
+    state = 0
+    for i in range(arr.size):
+        b = arr[i]
+        if b < 0x80 and state == 0:
+            continue
+        state = _UTF8_TRANS[state + _UTF8_CLASS[b]]
+        if state == 12:
+            return False
+    return state == 0
+
+
+# Per lead byte: sequence length (1 = not a valid lead), and the
+# allowed range of the second byte
+_UTF8_NEED = np.ones(256, dtype=np.int32)
+_UTF8_NEED[:0x80]     = 0
+_UTF8_NEED[0xC2:0xE0] = 2
+_UTF8_NEED[0xE0:0xF0] = 3
+_UTF8_NEED[0xF0:0xF5] = 4
+_UTF8_LO = np.full(256, 0x80, dtype=np.int32)
+_UTF8_HI = np.full(256, 0xBF, dtype=np.int32)
+_UTF8_LO[0xE0], _UTF8_HI[0xED] = 0xA0, 0x9F   # no overlongs / surrogates
+_UTF8_LO[0xF0], _UTF8_HI[0xF4] = 0x90, 0x8F   # no overlongs / > U+10FFFF
+
+
+def _replace_counts(arr, final):
+    """
+    Decodes the uint8 array with errors='replace' without building a str.
+    Returns (chars, fffd, end): the length of the decoded text, how many
+    U+FFFD it has, and where decoding stopped — before a sequence the
+    array ends in the middle of, unless final.
+    """
+    n = arr.size
+    chars = 0
+    fffd  = 0
+    i = 0
+    while i < n:
+        b = arr[i]
+        need = _UTF8_NEED[b]
+        if need == 0:          # ASCII
+            chars += 1
+            i += 1
+            continue
+        if need == 1:          # stray continuation or invalid lead
+            chars += 1
+            fffd  += 1
+            i += 1
+            continue
+        # Absorb the continuation bytes that fit, like the 'replace' handler
+        j = i + 1
+        if j < n and _UTF8_LO[b] <= arr[j] <= _UTF8_HI[b]:
+            j += 1
+            while j < i + need and j < n and (arr[j] & 0xC0) == 0x80:
+                j += 1
+        if j == n and j - i < need and not final:
+            break
+        chars += 1
+        if j - i < need or (b == 0xEF and arr[i + 1] == 0xBF and arr[i + 2] == 0xBD):
+            fffd += 1
+        i = j
+    return chars, fffd, i
+
+
+def _decode_counts(arr, final):
+    """_replace_counts done by the 'replace' decoder, for when numba won't load."""
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    text = decoder.decode(memoryview(arr), final)
+    return len(text), text.count("\ufffd"), arr.size - len(decoder.getstate()[0])
+
+
+def _lazy_njit(func, fallback):
+    """
+    njit(cache=True)(func), with numba imported and func compiled on the
+    first call. An installed numba can still fail to import (it pins
+    NumPy versions) or to compile; then _HAS_NUMBA is switched off so
+    callers take their pure-Python paths, and this call uses fallback.
+    """
+    compiled = None
+
+    @functools.wraps(func)
+    def call(*args):
+        nonlocal compiled
+        global _HAS_NUMBA
+        if compiled is None:
+            try:
+                from numba import njit
+                compiled = njit(cache=True)(func)
+                return compiled(*args)    # compiles for these argument types
+            except Exception:
+                _HAS_NUMBA = False
+                compiled = fallback
+        return compiled(*args)
+    return call
+
+
+if _HAS_NUMBA:
+    _dfa_validate   = _lazy_njit(_dfa_validate, lambda arr: _strict_decodes(arr))
+    _replace_counts = _lazy_njit(_replace_counts, _decode_counts)
+
+_kernels_loaded = threading.Event()
+
+
+def load_kernels():
+    """
+    Imports numba and loads both kernels for the read-only uint8 arrays
+    scans pass them, so the first scan doesn't pay for it. Takes up to a
+    second with a cold JIT cache; meant for a background thread.
+    """
+    if _HAS_NUMBA:
+        arr = np.frombuffer("é".encode(), dtype=np.uint8)
+        _dfa_validate(arr)
+        _replace_counts(arr, True)
+    _kernels_loaded.set()
+
+
+def kernels_loaded():
+    """True once scans no longer have a JIT import or compile ahead of them."""
+    return not _HAS_NUMBA or _kernels_loaded.is_set()
+
 # Explicitly supported open data portal formats
 SUPPORTED_TEXT_FORMATS = (
     ".csv", ".json", ".geojson",        # Core open data formats
@@ -18,7 +238,78 @@ SUPPORTED_TEXT_FORMATS = (
     ".py", ".js", ".ts",                # Code
 )
 
-def scan_single_file(file_path):
+# The two results most files end up with. Copying a template and
+# setting the fields that vary is cheaper than building the dict anew.
+_BINARY_TEMPLATE = {
+    "utf_percent":     0.0,
+    "non_utf_percent": 100.0,
+    "total_chars":     0,
+    "non_utf_chars":   0,
+    "is_utf":          False,
+    "is_mostly_utf":   False,
+    "is_binary":       True,
+    "detected_encoding": "Binary",
+    "error":           None
+}
+
+_UTF_TEMPLATE = {
+    "utf_percent":     100.0,
+    "non_utf_percent": 0.0,
+    "total_chars":     0,
+    "non_utf_chars":   0,
+    "is_utf":          True,
+    "is_mostly_utf":   True,
+    "is_binary":       False,
+    "detected_encoding": "UTF-8",
+    "error":           None
+}
+
+
+def binary_result():
+    """Result for a binary file, which is not checked at all."""
+    return _BINARY_TEMPLATE.copy()
+
+
+def skipped_result():
+    """Result for a file over MAX_FILE_SIZE, which is not read."""
+    return {
+        "utf_percent":     0.0,
+        "non_utf_percent": 0.0,
+        "total_chars":     0,
+        "non_utf_chars":   0,
+        "is_utf":          False,
+        "is_mostly_utf":   False,
+        "is_binary":       False,
+        "is_skipped":      True,
+        "detected_encoding": f"Skipped (> {MAX_FILE_SIZE // (1024 * 1024)} MB)",
+        "error":           None
+    }
+
+
+def utf_result(total_chars, label="UTF-8"):
+    """Result for content that is 100% valid UTF-8."""
+    r = _UTF_TEMPLATE.copy()
+    r["total_chars"]       = total_chars
+    r["detected_encoding"] = label
+    return r
+
+
+def error_result(e):
+    """Result for a file that could not be read or scanned."""
+    return {
+        "utf_percent":     0.0,
+        "non_utf_percent": 100.0,
+        "total_chars":     0,
+        "non_utf_chars":   0,
+        "is_utf":          False,
+        "is_mostly_utf":   False,
+        "is_binary":       False,
+        "detected_encoding": "Error",
+        "error":           str(e)
+    }
+
+
+def scan_single_file(file_path, cache=True):
     """
     Accurate UTF detection using a two-step approach:
     
@@ -31,72 +322,409 @@ def scan_single_file(file_path):
     
     This prevents false positives where Latin-1/Windows-1252 files
     (which are mostly ASCII) get wrongly reported as UTF-8.
+
+    With cache=False the result cache is neither read nor written.
     """
     ext = os.path.splitext(file_path)[1].lower()
 
     # Binary files — flag immediately, no scanning needed
     if ext in BINARY_EXTENSIONS:
-        return {
-            "utf_percent":     0.0,
-            "non_utf_percent": 100.0,
-            "total_chars":     0,
-            "non_utf_chars":   0,
-            "is_utf":          False,
-            "is_mostly_utf":   False,
-            "is_binary":       True,
-            "detected_encoding": "Binary",
-            "error":           None
-        }
+        return binary_result()
 
     try:
-        with open(file_path, "rb") as f:
-            raw = f.read()
+        st = os.stat(file_path)
+        if st.st_size > MAX_FILE_SIZE:
+            return skipped_result()
+        if not cache:
+            return _scan_file(file_path, st.st_size)
+        # Unchanged files (same mtime and size) come straight from the cache
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        info = _cache_get(key)
+        if info is None:
+            info = _scan_file(file_path, st.st_size)
+            _cache_put(key, info)
+        return info
+    except Exception as e:
+        return error_result(e)
 
-        # Empty file
-        if len(raw) == 0:
-            return {
-                "utf_percent":     100.0,
-                "non_utf_percent": 0.0,
-                "total_chars":     0,
-                "non_utf_chars":   0,
-                "is_utf":          True,
-                "is_mostly_utf":   True,
-                "is_binary":       False,
-                "detected_encoding": "UTF-8 (empty)",
-                "error":           None
-            }
-
-        # ── Step 1: Strict UTF-8 decode ──
-        # If this succeeds, the file is genuinely 100% valid UTF-8
+
+def _scan_file(file_path, size):
+    # Large files are mapped rather than copied: the OS pages them in as
+    # scan_bytes touches them, and scan_bytes releases them again behind
+    # it. Smaller ones are streamed in chunks. Either way memory stays
+    # bounded, and a binary first chunk ends the scan.
+    with open(file_path, "rb") as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return scan_bytes(mm)
+        state = ValidatorState()
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            state.update(chunk)
+            if state.decided_binary:
+                break
+    return state.finalize()
+
+
+# ---------------- Result cache ----------------
+# Results are cached on disk keyed by (path, mtime_ns, size), so
+# re-scanning an unchanged folder skips the actual checks. The cache is
+# best effort: if it can't be opened or written, files are just scanned.
+# An entry is replaced when its file changes; prune_cache() drops those
+# of files that no longer exist.
+#
+# The UTF_VALIDATOR_CACHE environment variable moves the database, and
+# setting it empty turns the cache off. CACHE_PATH can also be set to
+# another path, or None, at run time.
+CACHE_PATH = os.environ.get(
+    "UTF_VALIDATOR_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "utf-validator", "cache.db"),
+) or None
+
+# Bump when a change to the checks makes cached results stale
+CACHE_VERSION = 5
+
+_cache_lock = threading.Lock()
+_cache_conn = None
+_cache_for  = None    # (pid, path, version) _cache_conn was opened for
+
+
+def _cache_db():
+    global _cache_conn, _cache_for
+    # A connection must not be reused in a forked worker, so a new process
+    # opens its own, as does a change of CACHE_PATH or CACHE_VERSION
+    current = (os.getpid(), CACHE_PATH, CACHE_VERSION)
+    if _cache_for != current:
+        if _cache_conn is not None and _cache_for[0] == current[0]:
+            _cache_conn.close()
+        _cache_for  = current
+        _cache_conn = None
+        if CACHE_PATH is None:
+            return None
         try:
-            raw.decode("utf-8", errors="strict")
+            os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+            conn = sqlite3.connect(CACHE_PATH, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")     # readers don't block the writer
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS cache")
+                conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, result TEXT)"
+            )
+            _cache_conn = conn
+        except (OSError, sqlite3.Error):
+            pass
+    return _cache_conn
+
+
+def _cache_get(key):
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT result FROM cache WHERE path=? AND mtime=? AND size=?", key
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    return json.loads(row[0]) if row else None
+
+
+def _cache_put(key, info):
+    if info.get("error"):
+        return    # read errors may be temporary
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (path, mtime, size, result) VALUES (?, ?, ?, ?)",
+                    (*key, json.dumps(info)),
+                )
+        except sqlite3.Error:
+            pass
+
+
+def prune_cache():
+    """
+    Drops the cached results of files that no longer exist, and returns
+    how many there were. Without it the cache keeps the results of
+    deleted or renamed files for good. Stats every cached path, so it is
+    meant for a background thread.
+    """
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return 0
+        try:
+            paths = [path for (path,) in conn.execute("SELECT path FROM cache")]
+        except sqlite3.Error:
+            return 0
+    gone = [(path,) for path in paths if not os.path.isfile(path)]
+    if not gone:
+        return 0
+    with _cache_lock:
+        conn = _cache_db()
+        if conn is None:
+            return 0
+        try:
+            with conn:
+                conn.executemany("DELETE FROM cache WHERE path=?", gone)
+        except sqlite3.Error:
+            return 0
+    return len(gone)
+
+
+def _is_pe(first):
+    """
+    True if first is the start of a Windows executable. "MZ" alone also
+    starts plenty of text, so the DOS header's e_lfanew field (at 0x3C)
+    must point to a "PE\\0\\0" signature.
+    """
+    if len(first) < 0x40 or not first.startswith(b"MZ"):
+        return False
+    pe = int.from_bytes(first[0x3C:0x40], "little")
+    return first[pe:pe + 4] == b"PE\0\0"
+
+
+def _looks_binary(first):
+    """
+    True if the first chunk of a file starts with a binary signature or,
+    unless it starts with a UTF-16/32 BOM, is NUL-heavy.
+    """
+    if first.startswith(_BINARY_MAGIC) or _is_pe(first):
+        return True
+    return not first.startswith(_WIDE_BOMS) and first.count(b"\0") > len(first) * BINARY_NUL_RATIO
+
+
+def _strict_decodes(raw, start=0):
+    """True if raw[start:] is valid UTF-8, decoded a chunk at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")("strict")
+    try:
+        with memoryview(raw) as mv:
+            for i in range(start, len(mv), CHUNK_SIZE):
+                decoder.decode(mv[i:i + CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _slices(arr):
+    """
+    Yields (start, end) bounds of about SCAN_SLICE_SIZE bytes covering arr,
+    moved back so no slice starts on a continuation byte. A sequence is then
+    never split between slices unless it is invalid anyway.
+    """
+    n = arr.size
+    start = 0
+    while start < n:
+        end = min(start + SCAN_SLICE_SIZE, n)
+        lowest = max(end - 3, start + 1)
+        while lowest < end < n and arr[end] & 0xC0 == 0x80:
+            end -= 1
+        yield start, end
+        start = end
+
+
+def _release(raw, done, end):
+    """
+    Drops the pages of raw[done:end] from this process if raw is an mmap,
+    so resident memory doesn't grow with the file; the OS pages them back
+    in if they are touched again. Returns the new done offset.
+    """
+    if not isinstance(raw, mmap.mmap) or not hasattr(mmap, "MADV_DONTNEED"):
+        return end
+    end -= end % mmap.PAGESIZE
+    if end > done:
+        raw.madvise(mmap.MADV_DONTNEED, done, end - done)
+        return end
+    return done
+
+
+def scan_bytes(raw):
+    """
+    Runs the two-step check of scan_single_file on file contents already
+    in memory. raw can be bytes or any read-only buffer such as an mmap;
+    it is checked a slice at a time and never copied as a whole.
+    """
+    # Empty file
+    if len(raw) == 0:
+        return utf_result(0, "UTF-8 (empty)")
+
+    # Binary content behind a text extension
+    if _looks_binary(bytes(raw[:CHUNK_SIZE])):
+        return binary_result()
+
+    # Check for BOM (UTF-8 with BOM is still UTF-8)
+    enc_label = "UTF-8 (BOM)" if raw[:3] == b'\xef\xbb\xbf' else "UTF-8"
+
+    # ── Step 1: Strict UTF-8 check ──
+    # If this succeeds, the file is genuinely 100% valid UTF-8. Slices
+    # with no byte >= 0x80 are ASCII, one char per byte, and need no
+    # checking. In the others every byte that isn't a continuation byte
+    # starts a char. None of the validators build a str.
+    arr   = np.frombuffer(raw, dtype=np.uint8)
+    chars = 0
+    done  = 0
+    valid = True
+    for start, end in _slices(arr):
+        piece = arr[start:end]
+        if (piece >= 0x80).any():
+            valid = _dfa_validate(piece) if _HAS_NUMBA else _strict_decodes(piece)
+            if not valid:
+                break
+            chars += int(np.count_nonzero((piece & 0xC0) != 0x80))
+        else:
+            chars += piece.size
+        done = _release(raw, done, end)
+    del arr, piece
+    if valid:
+        return utf_result(chars, enc_label)
+
+    # ── Step 2: chardet + invalid char count ──
+    # Streamed in chunks, so no str the size of the whole file is built
+    state = ValidatorState()
+    done  = 0
+    with memoryview(raw) as mv:
+        for i in range(0, len(mv), CHUNK_SIZE):
+            state.update(mv[i:i + CHUNK_SIZE])
+            done = _release(raw, done, min(i + CHUNK_SIZE, len(mv)))
+    return state.finalize()
+
+
+def _detect(sample):
+    """
+    chardet.detect, but fed a piece at a time through UniversalDetector
+    so it stops as soon as the detector is sure.
+    """
+    detector = _chardet.UniversalDetector()
+    with memoryview(sample) as mv:
+        for i in range(0, len(mv), DETECT_FEED_SIZE):
+            detector.feed(bytes(mv[i:i + DETECT_FEED_SIZE]))   # cchardet wants bytes
+            if detector.done:
+                break
+    detector.close()
+    return detector.result
+
+
+class ValidatorState:
+    """
+    Streaming form of the two-step check. Feed the content in chunks
+    with update(), then finalize() returns the usual result dict.
+
+    Chunks are decoded with a 'replace' decoder, or counted by the
+    JIT-compiled _replace_counts without building a str. A sequence split across
+    chunks is held back in _pending, so counts match decoding the whole
+    file at once. U+FFFD characters that were already in the file
+    (EF BF BD) are tracked separately: the content is strictly valid
+    UTF-8 exactly when every replacement char is one of those. Memory
+    stays bounded by one chunk plus the chardet samples.
+    """
+
+    def __init__(self):
+        self.size           = 0
+        self.total_chars    = 0
+        self.replaced_chars = 0       # U+FFFD in the decoded text
+        self.genuine_fffd   = 0       # ... of which were already in the file
+        self.decided_binary = False   # set from the first chunk; callers can stop reading
+        self._head    = bytearray()   # start of the file for the BOM check and chardet
+        self._tail    = b""           # end of the file for chardet
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._pending = b""           # unfinished sequence at the end of the last chunk
+        self._bad_at  = None          # offset of the first invalid byte
+        self._window  = b""           # bytes around it for chardet
+
+    def update(self, chunk):
+        if not isinstance(chunk, bytes):
+            chunk = bytes(chunk)
+        if not chunk or self.decided_binary:
+            return
+        if self.size == 0 and _looks_binary(chunk):
+            self.decided_binary = True
+            return
+        self.size += len(chunk)
+
+        if len(self._head) < DETECT_SAMPLE_SIZE:
+            self._head += chunk[:DETECT_SAMPLE_SIZE - len(self._head)]
+
+        # The tail's last 2 bytes catch an EF BF BD split across chunks
+        self.genuine_fffd += chunk.count(b"\xef\xbf\xbd") + (self._tail[-2:] + chunk[:2]).count(b"\xef\xbf\xbd")
+        if len(chunk) >= DETECT_TAIL_SIZE:
+            self._tail = chunk[-DETECT_TAIL_SIZE:]
+        else:
+            self._tail = (self._tail + chunk)[-DETECT_TAIL_SIZE:]
+
+        if self._pending:
+            chunk, self._pending = self._pending + chunk, b""
+        # ASCII chunk → one char per byte (a pending lead byte is never ASCII)
+        if chunk.isascii():
+            self.total_chars += len(chunk)
+            return
+        self._count(chunk, False)
+
+    def _count(self, chunk, final):
+        if _HAS_NUMBA:
+            chars, fffd, end = _replace_counts(np.frombuffer(chunk, dtype=np.uint8), final)
+            self._pending = chunk[end:]
+        else:
+            text  = self._decoder.decode(chunk, final)
+            chars = len(text)
+            fffd  = text.count("\ufffd")
+            # Keep the decoder's leftover bytes here, so every path sees them
+            self._pending = self._decoder.getstate()[0]
+            self._decoder.reset()
+        self.total_chars    += chars
+        self.replaced_chars += fffd
+        if fffd and self._bad_at is None:
+            self._find_bad(chunk, final)
+
+    def _find_bad(self, chunk, final):
+        """Records where the first invalid byte is, if chunk has one (its U+FFFD may be genuine)."""
+        try:
+            codecs.getincrementaldecoder("utf-8")("strict").decode(chunk, final)
+        except UnicodeDecodeError as e:
+            # chunk ends where the file read so far ends
+            self._bad_at = self.size - len(chunk) + e.start
+            lo = max(e.start - DETECT_WINDOW_SIZE // 2, 0)
+            self._window = chunk[lo:lo + DETECT_WINDOW_SIZE]
+
+    def finalize(self):
+        if self.decided_binary:
+            return binary_result()
+
+        # A sequence still unfinished at the end of the file is truncated
+        if self._pending:
+            self._count(self._pending, True)
+
+        # Empty file
+        if self.size == 0:
+            return utf_result(0, "UTF-8 (empty)")
+
+        # No replacement chars beyond the ones in the file → strictly valid UTF-8
+        if self.replaced_chars == self.genuine_fffd:
             # Check for BOM (UTF-8 with BOM is still UTF-8)
-            has_bom = raw.startswith(b'\xef\xbb\xbf')
-            enc_label = "UTF-8 (BOM)" if has_bom else "UTF-8"
-            total_chars = len(raw.decode("utf-8", errors="strict"))
-            return {
-                "utf_percent":     100.0,
-                "non_utf_percent": 0.0,
-                "total_chars":     total_chars,
-                "non_utf_chars":   0,
-                "is_utf":          True,
-                "is_mostly_utf":   True,
-                "is_binary":       False,
-                "detected_encoding": enc_label,
-                "error":           None
-            }
-        except UnicodeDecodeError:
-            pass  # Not pure UTF-8, continue to Step 2
-
-        # ── Step 2: Detect actual encoding with chardet ──
-        detection    = chardet.detect(raw)
+            has_bom = self._head[:3] == b"\xef\xbb\xbf"
+            return utf_result(self.total_chars, "UTF-8 (BOM)" if has_bom else "UTF-8")
+
+        # Not pure UTF-8 — detect the actual encoding from a sample of the file
+        sample = bytes(self._head)
+        # Head and tail may hold no invalid byte at all, which leaves
+        # chardet guessing from ASCII, so add the bytes around the first one
+        if self._bad_at is not None and len(sample) <= self._bad_at < self.size - DETECT_TAIL_SIZE:
+            sample += self._window
+        if self.size > len(self._head):
+            sample += self._tail[len(self._head) - self.size:]   # skip bytes already in head
+        detection = _detect(sample)
         detected_enc = detection.get("encoding") or "Unknown"
-        confidence   = detection.get("confidence", 0.0)
+        confidence   = detection.get("confidence") or 0.0   # cchardet gives None when unsure
 
-        # Now decode with replace to count bad bytes
-        decoded       = raw.decode("utf-8", errors="replace")
-        total_chars   = len(decoded)
-        non_utf_chars = decoded.count("\ufffd")
+        total_chars   = self.total_chars
+        non_utf_chars = self.replaced_chars
         utf_chars     = total_chars - non_utf_chars
 
         utf_percent     = (utf_chars / total_chars) * 100 if total_chars > 0 else 0.0
@@ -114,35 +742,90 @@ def scan_single_file(file_path):
             "error":           None
         }
 
-    except Exception as e:
-        return {
-            "utf_percent":     0.0,
-            "non_utf_percent": 100.0,
-            "total_chars":     0,
-            "non_utf_chars":   0,
-            "is_utf":          False,
-            "is_mostly_utf":   False,
-            "is_binary":       False,
-            "detected_encoding": "Error",
-            "error":           str(e)
-        }
+
+def walk_files(root):
+    """
+    Yields the DirEntry of every regular file below root, using a stack
+    instead of os.walk. DirEntry.path saves the join, and is_dir() /
+    is_file() reuse the type scandir already returned, so nothing is
+    stat()'d. Symlinks and SKIP_DIRS are not followed. A directory's
+    files come before its subdirectories, which are visited in order.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def scan_files(paths, progress=None):
+    """
+    Yields the scan_single_file result of each path, in order. Binary
+    extensions are flagged here, so they never reach a worker. The rest
+    are fanned out across processes, or across a few threads when there
+    are fewer than POOL_MIN_FILES. If the process pool breaks, the
+    remaining files are scanned in this process. progress(done, total)
+    is called after each result.
+    """
+    paths   = list(paths)
+    total   = len(paths)
+    binary  = [os.path.splitext(path)[1].lower() in BINARY_EXTENSIONS for path in paths]
+    scanned = _scan_many([path for path, is_bin in zip(paths, binary) if not is_bin])
+    for done, is_bin in enumerate(binary, start=1):
+        info = binary_result() if is_bin else next(scanned)
+        if progress is not None:
+            progress(done, total)
+        yield info
+
+
+def _scan_many(paths):
+    """scan_single_file over paths, in order, on threads or worker processes."""
+    if len(paths) < POOL_MIN_FILES:
+        # File reads release the GIL, so a few threads hide I/O latency
+        # without paying for worker process start-up
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            yield from ex.map(scan_single_file, paths)
+        return
+
+    # Validation is CPU-bound, so fan the files out across processes
+    workers   = os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    done      = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for info in ex.map(scan_single_file, paths, chunksize=chunksize):
+                done += 1
+                yield info
+    except (BrokenProcessPool, OSError):
+        # A worker died or the pool couldn't start; scan what's left here
+        for path in paths[done:]:
+            yield scan_single_file(path)
 
 
 def scan_folder(folder_path):
     """
-    Scans ALL files in the folder. Binary files are flagged instantly.
+    Scans all files in the folder, outside SKIP_DIRS. Binary files are flagged instantly.
     Returns:
       results: list of dicts with file path + detailed encoding info
-      skipped_files: always empty (nothing is skipped)
+      skipped_files: always empty (files over MAX_FILE_SIZE are in results, as skipped)
     """
+    entries = list(walk_files(folder_path))
     results = []
+    for entry, info in zip(entries, scan_files([e.path for e in entries])):
+        info["file"]     = entry.path
+        info["filename"] = entry.name
+        results.append(info)
 
-    for root, dirs, files in os.walk(folder_path):
-        for f in files:
-            full_path = os.path.join(root, f)
-            info          = scan_single_file(full_path)
-            info["file"]     = full_path
-            info["filename"] = f
-            results.append(info)
-
-    return results, []
\ No newline at end of file
+    return results, []